@@ -47,7 +47,7 @@ def create_project_structure():
         "page_load_timeout": 60,
         "max_retries": 2,
         "retry_delay": 2,
-        "wait_between_urls": 2
+        "host_min_interval": 2
     }
 
     import json
@@ -9,6 +9,20 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
+from utils.history_store import HistoryStore, RUN_ID_ENV
+from utils.http_probe import HTTPProbe
+from utils.run_journal import RunJournal
+from utils.web_handler import WebAutomation
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--resume",
+        action="store_true",
+        default=False,
+        help="Skip rows already recorded in the run journal and rebuild reports from it"
+    )
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_teardown():
     """Setup and teardown for the entire test session."""
@@ -18,12 +32,27 @@ def setup_teardown():
         attachment_type=allure.attachment_type.TEXT
     )
     yield
+    WebAutomation.shutdown_driver_pool()
+    WebAutomation.shutdown_screenshot_sink()
+    HTTPProbe.close_session()
+    RunJournal.close_shared()
+    HistoryStore.close_shared()
     allure.attach(
         body="Test session ended",
         name="Session End",
         attachment_type=allure.attachment_type.TEXT
     )
 
+@pytest.fixture
+def isolated_run_stores(tmp_path, monkeypatch):
+    """Point the shared run journal and history store at a temporary directory"""
+    monkeypatch.delenv(RUN_ID_ENV, raising=False)
+    monkeypatch.setattr(RunJournal, "_shared", RunJournal(str(tmp_path / "journal")))
+    monkeypatch.setattr(HistoryStore, "_shared", HistoryStore(str(tmp_path / "history.sqlite3")))
+    yield tmp_path
+    RunJournal.close_shared()
+    HistoryStore.close_shared()
+
 @pytest.fixture(scope="function", autouse=True)
 def test_case_setup(request):
     """Setup and teardown for each test case."""
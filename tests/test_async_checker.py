@@ -0,0 +1,120 @@
+# tests/test_async_checker.py
+import asyncio
+import os
+import sys
+import pytest
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.async_checker import AsyncStatusChecker
+
+
+async def handle_request(reader, writer):
+    """Minimal HTTP server used as the checker's target"""
+    request_line = await reader.readline()
+    while (await reader.readline()) not in (b"\r\n", b""):
+        pass
+
+    path = request_line.split()[1].decode()
+    if path == "/ok":
+        response = "HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+    elif path == "/redirect":
+        response = "HTTP/1.1 302 Found\r\nLocation: /ok\r\nContent-Length: 0\r\n\r\n"
+    elif path == "/error":
+        response = "HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\n\r\n"
+    elif path == "/slow":
+        await asyncio.sleep(2)
+        response = "HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+    else:
+        response = "HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n"
+
+    writer.write(response.encode())
+    await writer.drain()
+    writer.close()
+
+
+async def check_against_local_server(paths, **checker_options):
+    server = await asyncio.start_server(handle_request, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    urls = [(f"http://127.0.0.1:{port}{path}", row) for row, path in enumerate(paths, 2)]
+    try:
+        checker = AsyncStatusChecker(**checker_options)
+        return await checker.check_all(urls)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@allure.epic("URL Processing")
+@allure.feature("Async Status Checker")
+class TestAsyncStatusChecker:
+
+    def test_results_keep_input_order_and_shape(self):
+        paths = ["/ok", "/missing", "/redirect", "/error"]
+        results = asyncio.run(check_against_local_server(paths, timeout=5))
+
+        assert [r['url'].rsplit("/", 1)[1] for r in results] == [p.strip("/") for p in paths]
+        assert [r['status'] for r in results] == ['Success', 'Failed', 'Success', 'Failed']
+        assert results[1]['error'] == "HTTP 404 Error"
+        assert results[2]['final_url'].endswith("/ok")
+        assert results[3]['error'] == "HTTP 503 Error"
+        for result in results:
+            assert {'url', 'status', 'load_time', 'error', 'steps'} <= set(result)
+            assert result['load_time'] > 0
+
+    def test_timeout_is_reported(self):
+        results = asyncio.run(check_against_local_server(["/slow"], timeout=0.3))
+
+        assert results[0]['status'] == 'Failed'
+        assert results[0]['error'] == "Connection timed out"
+
+    def test_connection_refused_is_classified(self):
+        async def closed_port():
+            server = await asyncio.start_server(handle_request, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            return await AsyncStatusChecker(timeout=5).check_all([(f"http://127.0.0.1:{port}/", 2)])
+
+        results = asyncio.run(closed_port())
+
+        assert results[0]['error'] == "Connection refused by the server"
+
+    @pytest.mark.parametrize("per_host_limit", [1, 3])
+    def test_per_host_limit_bounds_concurrency(self, per_host_limit):
+        in_flight = 0
+        peak = 0
+
+        async def counting_handler(reader, writer):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            await handle_request(reader, writer)
+
+        async def run():
+            server = await asyncio.start_server(counting_handler, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                checker = AsyncStatusChecker(per_host_limit=per_host_limit, timeout=5)
+                return await checker.check_all([(f"http://127.0.0.1:{port}/ok", row) for row in range(8)])
+            finally:
+                server.close()
+                await server.wait_closed()
+
+        results = asyncio.run(run())
+
+        assert all(r['status'] == 'Success' for r in results)
+        assert peak == per_host_limit
+
+    def test_waiting_for_a_busy_host_is_not_a_timeout(self):
+        # Each request takes 2s; queued behind each other they finish well past the 3s timeout
+        results = asyncio.run(check_against_local_server(["/slow"] * 4, per_host_limit=1, timeout=3))
+
+        assert [r['status'] for r in results] == ['Success'] * 4
+        # Each load time covers its own exchange only, not the queueing before it
+        assert all(1900 <= r['load_time'] < 3000 for r in results)
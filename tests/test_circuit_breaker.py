@@ -0,0 +1,67 @@
+# tests/test_circuit_breaker.py
+import os
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from utils.concurrent_runner import ConcurrentRunner
+from utils.dns_resolver import DNSResolver
+from utils.retry_policy import RetryPolicy
+
+REFUSED = {'status': 'Failed', 'error': 'Connection refused by the server'}
+NOT_FOUND = {'status': 'Failed', 'error': 'HTTP 404 Error'}
+SUCCESS = {'status': 'Success', 'error': None}
+
+
+@allure.epic("URL Processing")
+@allure.feature("Circuit Breaker")
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_connection_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+        breaker.record("down.example", REFUSED)
+        breaker.record("down.example", NOT_FOUND)
+        breaker.record("down.example", REFUSED)
+        assert breaker.state("down.example") == CLOSED
+
+        breaker.record("down.example", REFUSED)
+        assert breaker.state("down.example") == OPEN
+        assert not breaker.allow("down.example")
+        assert breaker.allow("up.example")
+
+    def test_half_open_probe_after_cooldown(self):
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+        breaker.record("down.example", REFUSED)
+
+        assert breaker.allow("down.example")
+        assert breaker.state("down.example") == HALF_OPEN
+        assert not breaker.allow("down.example")
+
+        breaker.record("down.example", REFUSED)
+        assert breaker.state("down.example") == OPEN
+
+        assert breaker.allow("down.example")
+        breaker.record("down.example", SUCCESS)
+        assert breaker.state("down.example") == CLOSED
+
+    def test_runner_fails_fast_once_open(self, monkeypatch, isolated_run_stores):
+        monkeypatch.setattr(CircuitBreaker, "from_config",
+                            classmethod(lambda cls: cls(failure_threshold=2, cooldown=60)))
+        monkeypatch.setattr(RetryPolicy, "from_config", classmethod(lambda cls: cls(max_retries=0)))
+        monkeypatch.setattr(DNSResolver, "_shared", DNSResolver(resolver=lambda host: ["127.0.0.1"]))
+        processed = []
+
+        def process(url, row_number):
+            processed.append(url)
+            return dict(REFUSED, url=url, load_time=1, steps=[])
+
+        urls = [(f"down.example/page{row}", row) for row in range(2, 7)]
+        results = ConcurrentRunner.run(urls, process_func=process, keep_results=True)
+
+        assert len(processed) == 2
+        assert [bool(r.get('circuit_open')) for r in results] == [False, False, True, True, True]
+        assert results[-1]['error'].startswith("Circuit open for down.example")
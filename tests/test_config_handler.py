@@ -0,0 +1,38 @@
+# tests/test_config_handler.py
+import json
+import os
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils import config_handler
+from utils.config_handler import Configuration
+
+
+@allure.epic("URL Processing")
+@allure.feature("Configuration")
+class TestConfiguration:
+
+    def test_config_is_read_once_until_the_file_changes(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"max_workers": 3}))
+        monkeypatch.setattr(config_handler, "CONFIG_PATH", str(path))
+        monkeypatch.setattr(Configuration, "_config", None)
+        monkeypatch.setattr(Configuration, "_config_mtime", None)
+        reads = []
+        load_config = Configuration.load_config
+        monkeypatch.setattr(Configuration, "load_config", staticmethod(lambda: reads.append(1) or load_config()))
+
+        first = Configuration.get_config()
+        first["max_workers"] = 99
+        assert Configuration.get_config()["max_workers"] == 3
+        assert Configuration.get_run_profile()["name"] == first["run_profile"]
+        assert len(reads) == 1
+
+        path.write_text(json.dumps({"max_workers": 5}))
+        os.utime(path, ns=(0, 10 ** 9))
+        assert Configuration.get_config()["max_workers"] == 5
+        assert len(reads) == 2
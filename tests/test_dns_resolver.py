@@ -0,0 +1,108 @@
+# tests/test_dns_resolver.py
+import os
+import socket
+import sys
+import threading
+from time import sleep
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.concurrent_runner import ConcurrentRunner
+from utils.dns_resolver import DNSResolver
+from utils.history_store import HistoryStore, RUN_ID_ENV
+
+
+class StubResolver:
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, host):
+        with self.lock:
+            self.calls.append(host)
+        if host not in self.records:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return self.records[host]
+
+
+@allure.epic("URL Processing")
+@allure.feature("DNS Pre-resolution")
+class TestDNSResolver:
+
+    def test_unique_hosts_are_resolved_once(self):
+        stub = StubResolver({"example.com": ["93.184.216.34"]})
+        resolver = DNSResolver(resolver=stub)
+
+        answers = resolver.resolve_all(["example.com", "EXAMPLE.com:8443", "user@example.com", "dead.invalid"])
+        resolver.resolve_all(["example.com", "dead.invalid"])
+
+        assert sorted(stub.calls) == ["dead.invalid", "example.com"]
+        assert answers["example.com"]["addresses"] == ["93.184.216.34"]
+        assert resolver.is_unresolvable(answers, "dead.invalid")
+        assert not resolver.is_unresolvable(answers, "example.com:8443")
+
+    def test_expired_answers_are_resolved_again(self):
+        stub = StubResolver({})
+        resolver = DNSResolver(resolver=stub, negative_ttl=0)
+
+        resolver.resolve("dead.invalid")
+        resolver.resolve("dead.invalid")
+
+        assert stub.calls == ["dead.invalid", "dead.invalid"]
+
+    def test_temporary_failures_are_not_cached(self):
+        def flaky(host):
+            raise socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+
+        resolver = DNSResolver(resolver=flaky)
+        answers = resolver.resolve_all(["example.com"])
+
+        assert answers == {"example.com": None}
+        assert not resolver.is_unresolvable(answers, "example.com")
+
+    def test_timeout_applies_per_lookup(self):
+        hung = threading.Event()
+
+        def slow(host):
+            if host == "hung.example":
+                hung.wait()
+            sleep(0.02)
+            return ["10.0.0.1"]
+
+        # 60 lookups of 20ms on 4 threads take ~0.3s in total, longer than the 0.1s timeout
+        hosts = [f"host{i}.example" for i in range(60)] + ["hung.example"]
+        resolver = DNSResolver(resolver=slow, concurrency=4, timeout=0.1)
+        try:
+            answers = resolver.resolve_all(hosts)
+        finally:
+            hung.set()
+
+        assert answers["hung.example"] is None
+        assert all(answers[host] and answers[host]['resolved'] for host in hosts[:-1])
+
+    def test_runner_fails_unresolvable_urls_without_processing(self, monkeypatch, isolated_run_stores):
+        stub = StubResolver({"example.com": ["93.184.216.34"]})
+        monkeypatch.setattr(DNSResolver, "_shared", DNSResolver(resolver=stub))
+        processed = []
+
+        def process(url, row_number):
+            processed.append(url)
+            return {'url': url, 'status': 'Success', 'error': None, 'load_time': 1, 'steps': []}
+
+        results = ConcurrentRunner.run(
+            [("https://dead.invalid/page", 2), ("example.com", 3)], process_func=process, keep_results=True
+        )
+
+        assert processed == ["example.com"]
+        assert results[0]['status'] == 'Failed'
+        assert results[0]['error'].startswith("DNS resolution failed")
+        assert results[1]['status'] == 'Success'
+
+        # The runner records its own run in the temporary history store and finishes it
+        runs = HistoryStore._shared._connection.execute("SELECT total, passed, finished_at FROM runs").fetchall()
+        assert [(total, passed) for total, passed, _ in runs] == [(2, 1)] and runs[0][2]
+        assert RUN_ID_ENV not in os.environ
@@ -0,0 +1,108 @@
+# tests/test_driver_pool.py
+import os
+import sys
+import threading
+import pytest
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Stands in for a Chrome WebDriver; ``hang`` makes script calls block until released"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.origin = "https://page.example"
+        self.cleared_origins = []
+        self.hang = None
+
+    def execute_script(self, script):
+        if self.hang:
+            self.hang.wait()
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return self.origin if "location.origin" in script else 1
+
+    def execute_cdp_cmd(self, command, params):
+        if command == "Storage.clearDataForOrigin":
+            self.cleared_origins.append(params["origin"])
+
+    def get(self, url):
+        self.origin = "null"
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**options):
+    created = []
+
+    def factory():
+        created.append(FakeDriver())
+        return created[-1]
+
+    return DriverPool(factory, **options), created
+
+
+@allure.epic("URL Processing")
+@allure.feature("Driver Pool")
+class TestDriverPool:
+
+    def test_acquire_times_out_when_pool_is_exhausted(self):
+        pool, _ = make_pool(size=1, acquire_timeout=0.1)
+        pool.acquire()
+
+        with pytest.raises(TimeoutError):
+            pool.acquire()
+
+    def test_driver_recycled_after_max_uses(self):
+        pool, created = make_pool(size=1, max_uses=2)
+        for _ in range(2):
+            driver = pool.acquire()
+            pool.release(driver)
+
+        assert created[0].quit_called
+        assert pool.acquire() is not created[0]
+        assert len(created) == 2
+
+    def test_unhealthy_driver_is_replaced(self):
+        pool, created = make_pool(size=1)
+        pool.release(pool.acquire())
+        created[0].alive = False
+
+        driver = pool.acquire()
+
+        assert driver is created[1]
+        assert created[0].quit_called
+
+    def test_storage_cleared_for_each_visited_origin(self):
+        pool, created = make_pool(size=1)
+        driver = pool.acquire()
+        pool.release(driver, visited=["http://start.example:8080/path"])
+
+        assert sorted(driver.cleared_origins) == ["http://start.example:8080", "https://page.example"]
+        assert pool.acquire() is driver
+
+    def test_hung_browser_does_not_block_other_workers(self):
+        pool, created = make_pool(size=2)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        first.hang = threading.Event()
+
+        # This worker's health check hangs on the unresponsive browser
+        worker = threading.Thread(target=pool.acquire)
+        worker.start()
+        try:
+            releaser = threading.Thread(target=pool.release, args=(second,))
+            releaser.start()
+            releaser.join(timeout=2)
+            assert not releaser.is_alive()
+        finally:
+            first.hang.set()
+            worker.join(timeout=2)
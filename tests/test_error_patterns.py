@@ -0,0 +1,58 @@
+# tests/test_error_patterns.py
+import errno
+import os
+import socket
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.error_patterns import classify_network_error, match_content_error, match_net_error
+
+
+class WrappedError(Exception):
+    """Shaped like urllib3's MaxRetryError, which keeps the underlying error in ``reason``"""
+
+    def __init__(self, reason):
+        super().__init__("Max retries exceeded")
+        self.reason = reason
+
+
+@allure.epic("URL Processing")
+@allure.feature("Error Detection")
+class TestErrorPatterns:
+
+    def test_content_errors_ranked_by_status_code(self):
+        # 404 outranks 403 wherever the patterns appear in the page
+        assert match_content_error("Access denied. The page was not found.") == '404'
+        assert match_content_error("Forbidden", "Page Not Found") == '404'
+        assert match_content_error("ACCESS DENIED") == '403'
+        assert match_content_error(None, "503 Service Unavailable") == '503'
+        assert match_content_error("Welcome home", "") is None
+        # Overlapping codes: the digits hold both 504 and 404
+        assert match_content_error('', 'Order 1504043 shipped') == '404'
+
+    def test_net_error_codes(self):
+        assert match_net_error("This site can't be reached net::err_connection_refused") == \
+            "Connection refused by the server"
+        assert match_net_error("ERR_NAME_NOT_RESOLVED") == \
+            "DNS resolution failed - Unable to resolve domain name"
+        assert match_net_error("All good") is None
+        assert match_net_error(None) is None
+
+    def test_network_exceptions_are_classified_through_wrappers(self):
+        assert classify_network_error(socket.gaierror(socket.EAI_NONAME, "unknown")) == 'ERR_NAME_NOT_RESOLVED'
+        assert classify_network_error(WrappedError(ConnectionRefusedError())) == 'ERR_CONNECTION_REFUSED'
+        assert classify_network_error(OSError(errno.ENETUNREACH, "unreachable")) == 'ERR_NETWORK_UNREACHABLE'
+
+        try:
+            try:
+                raise ConnectionResetError()
+            except ConnectionResetError as e:
+                raise RuntimeError("request failed") from e
+        except RuntimeError as e:
+            assert classify_network_error(e) == 'ERR_CONNECTION_RESET'
+
+        assert classify_network_error(ValueError("bad")) is None
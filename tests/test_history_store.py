@@ -0,0 +1,58 @@
+# tests/test_history_store.py
+import os
+import sys
+from time import time
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.history_store import HistoryStore
+from utils.result_record import StepRecord
+
+
+@allure.epic("URL Processing")
+@allure.feature("Run History")
+class TestHistoryStore:
+
+    def test_failures_for_host(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "history.sqlite3"), batch_size=2)
+        run_id = store.start_run("headless")
+        old = time() - 40 * 86400
+
+        store.add(2, "https://Example.com:8443/a", {
+            'status': 'Failed', 'error': 'Connection refused by the server', 'end_time': time(),
+            'steps': [{'status': 'FAIL', 'timestamp': '10:00:00', 'message': 'refused'}],
+            'timing': {'dns': 1.5}, 'stage_timings': {'page_load/navigate': 20.0}
+        }, run_id=run_id)
+        store.add(3, "example.com/b", {'status': 'Success', 'end_time': time()}, run_id=run_id)
+        store.add(4, "example.com/old", {'status': 'Failed', 'error': 'HTTP 503 Error', 'end_time': old},
+                  run_id=run_id)
+        store.add(5, "other.example", {'status': 'Failed', 'error': 'HTTP 404 Error'}, run_id=run_id)
+        store.finish_run(run_id, total=2, passed=1)
+
+        failures = store.failures_for_host("example.com", days=30)
+        assert [f['url'] for f in failures] == ["https://Example.com:8443/a"]
+        assert failures[0]['run_id'] == run_id
+        assert len(store.failures_for_host("example.com", days=60)) == 2
+
+        connection = store._connection
+        assert connection.execute("SELECT COUNT(*) FROM steps").fetchone()[0] == 1
+        assert sorted(connection.execute("SELECT name FROM timings").fetchall()) == [
+            ('dns',), ('stage:page_load/navigate',)]
+        assert connection.execute("SELECT total, passed, failed FROM runs").fetchone() == (2, 1, 1)
+        store.close()
+
+    def test_steps_keep_epoch_timestamps(self, tmp_path):
+        store = HistoryStore(str(tmp_path / "history.sqlite3"))
+        run_id = store.start_run("headless", export=False)
+        step = StepRecord('INFO', 'Starting URL processing')
+        store.add(2, "example.com/a", {'status': 'Success', 'steps': [step]}, run_id=run_id)
+        store.add(3, "example.com/b", {'status': 'Failed'}, run_id=run_id)
+
+        assert store.recorded_rows(run_id) == {2, 3}
+        (timestamp,) = store._connection.execute("SELECT timestamp FROM steps").fetchone()
+        assert timestamp == step['timestamp']
+        assert abs(timestamp - time()) < 60
+        store.close()
@@ -0,0 +1,98 @@
+# tests/test_host_scheduler.py
+import os
+import sys
+import threading
+from time import monotonic
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.host_scheduler import HostScheduler
+
+
+@allure.epic("URL Processing")
+@allure.feature("Per-host Scheduling")
+class TestHostScheduler:
+
+    def test_other_hosts_are_not_delayed(self):
+        scheduler = HostScheduler(min_interval=0.3, max_in_flight=1)
+        for item, host in [(1, "a.com"), (2, "a.com"), (3, "b.com"), (4, "c.com")]:
+            scheduler.add(item, host)
+
+        start = monotonic()
+        order = []
+        for _ in range(3):
+            host, item = scheduler.get()
+            order.append(item)
+            scheduler.done(host)
+
+        # a.com's second URL must wait; b.com and c.com go straight through
+        assert order == [1, 3, 4]
+        assert monotonic() - start < 0.2
+
+        host, item = scheduler.get()
+        assert item == 2
+        assert monotonic() - start >= 0.3
+        scheduler.done(host)
+        assert scheduler.get() is None
+
+    def test_max_in_flight_per_host(self):
+        scheduler = HostScheduler(min_interval=0, max_in_flight=2)
+        for item in range(6):
+            scheduler.add(item, "a.com")
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal in_flight, peak
+            while True:
+                job = scheduler.get()
+                if job is None:
+                    return
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                threading.Event().wait(0.02)
+                with lock:
+                    in_flight -= 1
+                scheduler.done(job[0])
+
+        workers = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join(timeout=5)
+
+        assert peak == 2
+
+    def test_not_before_delays_requeued_item(self):
+        scheduler = HostScheduler(min_interval=0, max_in_flight=1)
+        start = monotonic()
+        scheduler.add("retry", "a.com", not_before=start + 0.2)
+        scheduler.add("fresh", "b.com")
+
+        assert scheduler.get()[1] == "fresh"
+        scheduler.done("b.com")
+        assert scheduler.get()[1] == "retry"
+        assert monotonic() - start >= 0.2
+
+    def test_idle_hosts_are_forgotten(self):
+        scheduler = HostScheduler(min_interval=0.05, max_in_flight=1)
+        for index in range(50):
+            scheduler.add(index, f"host{index}.com")
+        for _ in range(50):
+            host, _ = scheduler.get()
+            scheduler.done(host)
+        # Hosts still inside their interval keep pacing in case more work arrives
+        assert len(scheduler._next_start) == 50
+
+        threading.Event().wait(0.06)
+        scheduler.add("late", "late.com")
+        host, _ = scheduler.get()
+        scheduler.done(host)
+        assert set(scheduler._next_start) == {"late.com"}
+        assert not scheduler._pending and not scheduler._in_flight
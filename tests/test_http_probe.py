@@ -0,0 +1,81 @@
+# tests/test_http_probe.py
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.http_probe import HTTPProbe
+
+
+class ProbeHandler(BaseHTTPRequestHandler):
+    ROUTES = {
+        "/ok": (200, {'Content-Type': 'text/html', 'ETag': '"v1"'}),
+        "/image": (200, {'Content-Type': 'image/png'}),
+        "/redirect": (302, {'Location': '/ok'}),
+        "/error": (503, {}),
+    }
+
+    def do_GET(self):
+        status, headers = self.ROUTES.get(self.path, (404, {}))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@allure.epic("URL Processing")
+@allure.feature("Pre-flight Probe")
+class TestHTTPProbe:
+
+    def test_http_responses_are_classified(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ProbeHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            missing = HTTPProbe.probe(f"{base}/missing", timeout=5)
+            assert missing['hard_failure'] and missing['error'] == "HTTP 404 Error"
+            assert missing['duration'] < 1000
+
+            error = HTTPProbe.probe(f"{base}/error", timeout=5)
+            assert error['hard_failure'] and error['error'] == "HTTP 503 Error"
+
+            redirected = HTTPProbe.probe(f"{base}/redirect", timeout=5)
+            assert not redirected['hard_failure'] and redirected['error'] is None
+            assert redirected['redirects'] == 1 and redirected['final_url'].endswith("/ok")
+            assert redirected['etag'] == '"v1"'
+            # HTML is rendered to look for soft errors; other content is not without screenshots
+            assert HTTPProbe.needs_browser(redirected, capture_screenshots=False)
+            image = HTTPProbe.probe(f"{base}/image", timeout=5)
+            assert not HTTPProbe.needs_browser(image, capture_screenshots=False)
+            assert HTTPProbe.needs_browser(image, capture_screenshots=True)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_refused_and_unresolvable_hosts_fail_without_a_browser(self):
+        refused = HTTPProbe.probe(f"http://127.0.0.1:{closed_port()}/", timeout=5)
+        assert refused['hard_failure']
+        assert refused['error'] == "Connection refused by the server"
+        assert refused['duration'] < 1000
+
+        # .invalid is reserved and never resolves
+        unresolvable = HTTPProbe.probe("http://no-such-host.invalid/", timeout=5)
+        assert unresolvable['hard_failure']
+        assert unresolvable['error'] == "DNS resolution failed - Unable to resolve domain name"
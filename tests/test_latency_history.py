@@ -0,0 +1,80 @@
+# tests/test_latency_history.py
+import os
+import sys
+import threading
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.latency_history import LatencyHistory
+
+
+@allure.epic("URL Processing")
+@allure.feature("Adaptive Timeouts")
+class TestLatencyHistory:
+
+    def test_timeout_from_p99_is_clamped(self):
+        history = LatencyHistory(default_timeout=60, min_timeout=10, max_timeout=45,
+                                 safety_factor=3, min_samples=3)
+        for latency in (800, 900, 1000):
+            history.record("fast.example", latency)
+        for latency in (9000, 12000, 20000):
+            history.record("slow.example", latency)
+        history.record("new.example", 500)
+
+        assert history.timeout_for("fast.example") == 10
+        assert history.timeout_for("slow.example") == 45
+        assert history.timeout_for("new.example") == 60
+
+        history.max_timeout = 90
+        assert history.timeout_for("slow.example") == 60
+
+    def test_samples_persist_and_merge_across_runs(self, tmp_path):
+        path = str(tmp_path / "latency.json")
+        first = LatencyHistory(path=path, min_samples=1, max_samples=3)
+        second = LatencyHistory(path=path, min_samples=1, max_samples=3)
+        first.record("a.example", 1000)
+        second.record("b.example", 2000)
+        first.save()
+        second.save()
+
+        reloaded = LatencyHistory(path=path, min_samples=1, max_samples=3, safety_factor=2)
+        assert reloaded.timeout_for("a.example") == 10
+        assert reloaded.percentile("b.example") == 2000
+
+        for latency in (1, 2, 3, 4):
+            reloaded.record("a.example", latency)
+        reloaded.save()
+        assert LatencyHistory.load(path)["a.example"] == [2, 3, 4]
+
+    def test_timeouts_let_the_bound_grow(self):
+        history = LatencyHistory(min_timeout=10, max_timeout=60, safety_factor=3, min_samples=3)
+        for latency in (800, 900, 1000):
+            history.record("slowing.example", latency)
+        assert history.timeout_for("slowing.example") == 10
+
+        # The host now needs ~15s, so every load is cut off at 10s
+        history.record_timeout("slowing.example", 10)
+        assert history.timeout_for("slowing.example") == 30
+
+    def test_concurrent_saves_keep_every_host(self, tmp_path):
+        path = str(tmp_path / "latency.json")
+        histories = [LatencyHistory(path=path) for _ in range(8)]
+        for index, history in enumerate(histories):
+            history.record(f"host{index}.example", 1000 + index)
+
+        barrier = threading.Barrier(len(histories))
+
+        def save(history):
+            barrier.wait()
+            history.save()
+
+        threads = [threading.Thread(target=save, args=(history,)) for history in histories]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(LatencyHistory.load(path)) == sorted(f"host{index}.example" for index in range(8))
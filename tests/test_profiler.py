@@ -0,0 +1,59 @@
+# tests/test_profiler.py
+import json
+import os
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.profiler import Profiler, StageAggregator
+
+
+@allure.epic("URL Processing")
+@allure.feature("Stage Profiling")
+class TestProfiler:
+
+    def test_nested_and_repeated_spans(self):
+        profiler = Profiler()
+        with profiler.span("page_load"):
+            with profiler.span("navigate"):
+                pass
+            with profiler.span("navigate"):
+                pass
+        with profiler.span("screenshot"):
+            pass
+
+        timings = profiler.results()
+        assert set(timings) == {"page_load", "page_load/navigate", "screenshot"}
+        assert timings["page_load"] >= timings["page_load/navigate"] >= 0
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler(enabled=False)
+        with profiler.span("navigate"):
+            pass
+        assert profiler.results() == {}
+
+    def test_run_summary(self, tmp_path):
+        results = [{'stage_timings': {'navigate': value}} for value in range(1, 21)]
+        results.append({'status': 'Failed'})
+
+        stages = Profiler.aggregate(results)
+        assert stages['navigate'] == {'count': 20, 'sum': 210, 'mean': 10.5, 'max': 20, 'p95': 19}
+
+        path = Profiler.write_summary(results, output_dir=str(tmp_path))
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)['stages'] == stages
+        assert Profiler.write_summary([{'status': 'Failed'}], output_dir=str(tmp_path)) is None
+
+    def test_aggregator_memory_is_bounded(self):
+        aggregator = StageAggregator(reservoir_size=100)
+        for value in range(1, 10001):
+            aggregator.add({'stage_timings': {'navigate': value}})
+
+        stage = aggregator.stages()['navigate']
+        assert (stage['count'], stage['sum'], stage['max']) == (10000, 50005000, 10000)
+        assert len(aggregator._stages['navigate']['reservoir']) == 100
+        assert 8500 <= stage['p95'] <= 10000
+        assert aggregator.urls == 10000
@@ -0,0 +1,80 @@
+# tests/test_result_cache.py
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.http_probe import HTTPProbe
+from utils.result_cache import ResultCache
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Type', 'text/html')
+        self.end_headers()
+        self.wfile.write(b"<html>hello</html>")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def success(url):
+    return {'url': url, 'status': 'Success', 'error': None, 'steps': [],
+            'preflight': {'etag': '"v1"', 'last_modified': None}}
+
+
+@allure.epic("URL Processing")
+@allure.feature("Incremental Runs")
+class TestResultCache:
+
+    def test_normalize_url(self):
+        assert ResultCache.normalize_url("Example.COM") == "https://example.com/"
+        assert ResultCache.normalize_url("http://example.com:80/a?b=1#top") == "http://example.com/a?b=1"
+        assert ResultCache.normalize_url("https://example.com:8443") == "https://example.com:8443/"
+
+    def test_fresh_revalidated_and_changed_urls(self, tmp_path):
+        unchanged = {'changed': False, 'etag': '"v1"', 'last_modified': None, 'content_hash': None}
+        changed = {'changed': True, 'etag': '"v2"', 'last_modified': None, 'content_hash': None}
+        answers = {"b.example": unchanged, "c.example": changed}
+        path = str(tmp_path / "cache.json")
+
+        cache = ResultCache(path=path, ttl=3600)
+        urls = [("a.example", 2), ("b.example", 3), ("c.example", 4), ("d.example", 5)]
+        cache.update(urls, [success(url) for url, _ in urls[:3]] + [{'url': "d.example", 'status': 'Failed'}])
+        cache.save()
+
+        reloaded = ResultCache(path=path, ttl=3600, revalidate_fn=lambda url, **kwargs: answers[url])
+        for key in ("https://b.example/", "https://c.example/"):
+            reloaded._entries[key]['checked_at'] = time() - 7200
+
+        to_process, cached = reloaded.partition(urls)
+        assert to_process == [("c.example", 4), ("d.example", 5)]
+        assert cached[2]['cached'] and cached[2]['cache_status'] == 'fresh'
+        assert cached[3]['cache_status'] == 'revalidated'
+
+    def test_conditional_revalidation(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            assert not HTTPProbe.revalidate(url, etag='"v1"', timeout=5)['changed']
+
+            first = HTTPProbe.revalidate(url, timeout=5)
+            assert first['changed'] and first['content_hash']
+            assert not HTTPProbe.revalidate(url, content_hash=first['content_hash'], timeout=5)['changed']
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,42 @@
+# tests/test_result_record.py
+import json
+import os
+import pickle
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.result_record import ResultRecord, StepRecord, StepStatus, format_clock
+
+
+@allure.epic("URL Processing")
+@allure.feature("Result Records")
+class TestResultRecord:
+
+    def test_record_reads_like_a_result_dict(self):
+        result = ResultRecord(url="a.example", status='Failed', load_time=0, steps=[])
+        result['steps'].append(StepRecord(StepStatus.FAIL, "refused"))
+        result['timing'] = {'ttfb': 12}
+        result['screenshot_data'] = b"png"
+
+        assert 'end_time' not in result
+        assert result.get('end_time') is None
+        assert result.setdefault('attempts', 1) == 1
+        assert result.pop('screenshot_data') == b"png"
+        assert result['steps'][0]['status'] == 'FAIL'
+        assert f"{result['steps'][0]['status']}" == 'FAIL'
+
+        # Survives the trip to and from shard processes
+        copy = pickle.loads(pickle.dumps(result))
+        assert dict(copy) == dict(result)
+
+        data = json.loads(json.dumps(result.to_dict()))
+        assert data['timing'] == {'ttfb': 12}
+        step = data['steps'][0]
+        assert step['status'] == 'FAIL' and step['message'] == "refused"
+        assert format_clock(step['timestamp']) == format_clock(result['steps'][0]['timestamp'])
+        # Results journaled by older runs carry preformatted times
+        assert format_clock('10:00:00') == '10:00:00'
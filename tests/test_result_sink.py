@@ -0,0 +1,37 @@
+# tests/test_result_sink.py
+import os
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.result_sink import ResultSink
+from utils.run_journal import RunJournal
+
+
+@allure.epic("URL Processing")
+@allure.feature("Result Sink")
+class TestResultSink:
+
+    def test_results_read_back_in_row_order(self, tmp_path):
+        directory = str(tmp_path)
+        journal = RunJournal(directory, fsync_batch=1)
+        journal.append(3, "b.example", {'url': "b.example", 'status': 'Failed'})
+        journal.append(2, "a.example", {'url': "a.example", 'status': 'Failed'})
+        # A retried row's latest record wins
+        journal.append(2, "a.example", {'url': "a.example", 'status': 'Success'})
+        journal.close()
+
+        urls = [("a.example", 2), ("b.example", 3), ("c.example", 4)]
+        sink = ResultSink(directory, urls)
+        assert len(sink) == 3
+        assert sink.pending() == [("c.example", 4)]
+
+        results = list(sink)
+        assert [r['url'] for r in results] == ["a.example", "b.example", "c.example"]
+        assert [r['status'] for r in results] == ['Success', 'Failed', 'Failed']
+        assert results[2]['error'] == "No result recorded for this row"
+        # Re-iterable, so reports can take several passes
+        assert [r['url'] for r in sink] == ["a.example", "b.example", "c.example"]
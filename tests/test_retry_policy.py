@@ -0,0 +1,51 @@
+# tests/test_retry_policy.py
+import os
+import sys
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.concurrent_runner import ConcurrentRunner
+from utils.dns_resolver import DNSResolver
+from utils.retry_policy import RetryPolicy
+
+
+@allure.epic("URL Processing")
+@allure.feature("Retries")
+class TestRetryPolicy:
+
+    def test_only_transient_failures_are_retried(self):
+        policy = RetryPolicy(max_retries=2, retry_delay=0)
+        assert policy.should_retry({'status': 'Failed', 'error': 'Page load timeout'}, 1)
+        assert policy.should_retry({'status': 'Failed', 'error': 'HTTP 503 Error'}, 2)
+        assert not policy.should_retry({'status': 'Failed', 'error': 'HTTP 503 Error'}, 3)
+        assert not policy.should_retry({'status': 'Failed', 'error': 'HTTP 404 Error'}, 1)
+        assert not policy.should_retry({'status': 'Success', 'error': None}, 1)
+
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(retry_delay=1, backoff_factor=2, max_delay=3, jitter=0)
+        assert [policy.get_delay(attempt) for attempt in (1, 2, 3)] == [1, 2, 3]
+
+    def test_runner_requeues_transient_failures(self, monkeypatch, isolated_run_stores):
+        monkeypatch.setattr(RetryPolicy, "from_config",
+                            classmethod(lambda cls: cls(max_retries=2, retry_delay=0.01)))
+        monkeypatch.setattr(DNSResolver, "_shared", DNSResolver(resolver=lambda host: ["127.0.0.1"]))
+        calls = {}
+
+        def process(url, row_number):
+            calls[url] = calls.get(url, 0) + 1
+            if url == "flaky.example" and calls[url] < 2:
+                return {'url': url, 'status': 'Failed', 'error': 'Connection was reset',
+                        'load_time': 1, 'steps': []}
+            return {'url': url, 'status': 'Success', 'error': None, 'load_time': 1, 'steps': []}
+
+        results = ConcurrentRunner.run(
+            [("flaky.example", 2), ("stable.example", 3)], max_workers=2, process_func=process, keep_results=True
+        )
+
+        assert [r['status'] for r in results] == ['Success', 'Success']
+        assert results[0]['attempts'] == 2
+        assert results[0]['steps'][0]['status'] == 'RETRY'
+        assert results[1]['attempts'] == 1
@@ -0,0 +1,56 @@
+# tests/test_run_journal.py
+import os
+import sys
+import json
+import allure
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.result_sink import ResultSink
+from utils.run_journal import RunJournal
+
+
+@allure.epic("URL Processing")
+@allure.feature("Run Journal")
+class TestRunJournal:
+
+    def test_resume_skips_journaled_rows(self, tmp_path):
+        directory = str(tmp_path)
+        journal = RunJournal(directory, fsync_batch=1)
+        journal.append(2, "a.example", {'url': "a.example", 'status': 'Success', 'screenshot_data': b"png"})
+        journal.append(3, "b.example", {'url': "b.example", 'status': 'Failed'})
+        journal.close()
+
+        # A record torn by a crash is ignored
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"row": 4, "url": "c.exa')
+
+        urls = [("a.example", 2), ("b.example", 3), ("c.example", 4), ("changed.example", 5)]
+        completed = RunJournal.load(directory)
+        completed[5] = {'row': 5, 'url': "old.example", 'result': {}}
+
+        pending, done = RunJournal.split_completed(urls, completed)
+        assert pending == [("c.example", 4), ("changed.example", 5)]
+        assert done[2] == {'url': "a.example", 'status': 'Success'}
+
+        new_results = [{'url': "c.example"}, {'url': "changed.example"}]
+        merged = RunJournal.merge(urls, done, new_results)
+        assert [r['url'] for r in merged] == [url for url, _ in urls]
+
+        RunJournal.reset(directory)
+        assert RunJournal.load(directory) == {}
+
+    def test_latest_written_journal_wins(self, tmp_path):
+        # A resumed run's process can have a lower pid than the interrupted one
+        older = tmp_path / "journal_900.jsonl"
+        newer = tmp_path / "journal_100.jsonl"
+        for path, status, mtime in ((older, 'Failed', 1_000), (newer, 'Success', 2_000)):
+            path.write_text(json.dumps({'row': 2, 'url': "a.example",
+                                        'result': {'url': "a.example", 'status': status}}) + "\n")
+            os.utime(path, (mtime, mtime))
+
+        assert RunJournal.journal_files(str(tmp_path)) == [str(older), str(newer)]
+        assert RunJournal.load(str(tmp_path))[2]['result']['status'] == 'Success'
+        assert [r['status'] for r in ResultSink(str(tmp_path), [("a.example", 2)])] == ['Success']
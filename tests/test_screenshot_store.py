@@ -0,0 +1,80 @@
+# tests/test_screenshot_store.py
+import io
+import os
+import sys
+import threading
+import allure
+from PIL import Image, ImageDraw
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from utils.report_handler import ReportHandler
+from utils.screenshot_sink import ScreenshotSink
+from utils.screenshot_store import ScreenshotStore
+
+
+def page_png(text="", shade=255):
+    """A template page: header bar, body and a line of text that differs per site"""
+    image = Image.new("RGB", (400, 300), (shade, shade, shade))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, 0, 400, 40], fill=(30, 60, 120))
+    draw.text((20, 120), text, fill=(0, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@allure.epic("URL Processing")
+@allure.feature("Screenshot Store")
+class TestScreenshotStore:
+
+    def test_resolve_complete_and_wait(self):
+        store = ScreenshotStore()
+        png = page_png("Welcome")
+        entry, is_new = store.resolve(png)
+        duplicate, duplicate_is_new = store.resolve(png)
+        assert is_new and not duplicate_is_new and duplicate is entry
+
+        waited = []
+        waiter = threading.Thread(target=lambda: waited.append(store.wait(duplicate, timeout=5)))
+        waiter.start()
+        store.complete(entry, [('screenshot', "/shots/a.png", png, 'png')])
+        waiter.join(timeout=5)
+
+        # Only paths and formats are kept, never the image bytes
+        assert waited == [[('screenshot', "/shots/a.png", 'png')]]
+        assert store.stats() == {'unique': 1, 'duplicates': 1}
+
+    def test_template_pages_are_distinct_by_default(self):
+        store = ScreenshotStore()
+        assert store.resolve(page_png("Site A - Home"))[1]
+        assert store.resolve(page_png("Site B - Home"))[1]
+
+    def test_near_duplicates_are_opt_in_and_tight(self):
+        store = ScreenshotStore(near_duplicates=True, phash_threshold=2)
+        entry, _ = store.resolve(page_png(shade=255))
+        # Re-encoded with an imperceptible shade change: same page
+        similar, similar_is_new = store.resolve(page_png(shade=254))
+        assert not similar_is_new and similar is entry
+        # A differently coloured page with the same layout is not
+        assert store.resolve(page_png(shade=120))[1]
+
+    def test_sink_wires_duplicates_to_the_stored_files(self, tmp_path):
+        sink = ScreenshotSink(writers=1, store=ScreenshotStore())
+        png = page_png("Parked domain")
+        first, second = {}, {}
+        try:
+            sink.submit(png, str(tmp_path / "first.png"), result=first)
+            sink.submit(png, str(tmp_path / "second.png"), result=second)
+            sink.flush()
+        finally:
+            sink.close()
+
+        assert first['screenshot_key'] == second['screenshot_key']
+        assert first['screenshot'] == second['screenshot'] == str(tmp_path / f"{first['screenshot_key'][:32]}.png")
+        assert os.listdir(tmp_path) == [os.path.basename(first['screenshot'])]
+        assert 'screenshot_data' not in second
+        # The report reads the shared file back from disk
+        assert ReportHandler.get_screenshot_data_uri(second).startswith("data:image/png;base64,")
@@ -2,7 +2,6 @@
 import pytest
 import allure
 import os
-import time
 from datetime import datetime
 import sys
 from time import time as current_time
@@ -16,6 +15,13 @@ from utils.excel_handler import ExcelHandler
 from utils.url_handler import URLHandler
 from utils.web_handler import WebAutomation
 from utils.report_handler import ReportHandler
+from utils.shard_runner import ShardRunner
+from utils.async_checker import AsyncStatusChecker
+from utils.history_store import HistoryStore
+from utils.profiler import Profiler, StageAggregator
+from utils.result_cache import ResultCache
+from utils.result_sink import ResultSink
+from utils.run_journal import RunJournal
 
 
 @allure.epic("URL Processing")
@@ -73,7 +79,7 @@ class TestURLProcessor:
             raise
 
     @allure.story("Process URLs from Excel with Error Detection")
-    def test_process_excel_urls(self, excel_urls):
+    def test_process_excel_urls(self, excel_urls, pytestconfig):
         """Test processing URLs from Excel file with error detection"""
         test_start_time = datetime.now()
         execution_start_time = current_time()
@@ -84,83 +90,133 @@ class TestURLProcessor:
             Configuration.backup_previous_reports()
             ExcelHandler.backup_previous_report()
 
-            results = []
             total_urls = len(excel_urls)
-            successful = 0
-            failed = 0
 
             print(f"\nStarting URL processing at: {test_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Total URLs to process: {total_urls}")
 
-            # Process each URL
-            for url, row_number in excel_urls:
-                url_start_time = current_time()
+            config = Configuration.get_config()
+            # Streamed results are written to the run journal as they complete and read back from it
+            streaming = config["stream_results"]
+            journal_dir = config["journal_dir"]
+
+            # With --resume, rows journaled by an interrupted run are not processed again
+            pending_urls, journaled = excel_urls, {}
+            if pytestconfig.getoption("--resume"):
+                if streaming:
+                    pending_urls = ResultSink(journal_dir, excel_urls).pending()
+                else:
+                    pending_urls, journaled = RunJournal.split_completed(excel_urls, RunJournal.load(journal_dir))
+                print(f"Resuming: {total_urls - len(pending_urls)} row(s) already completed, "
+                      f"{len(pending_urls)} to process")
+            else:
+                RunJournal.reset(journal_dir)
+
+            # Incremental mode: unchanged pages checked recently are served from the result cache
+            result_cache = ResultCache.from_config() if config["incremental_enabled"] else None
+            cached = {}
+            if result_cache and pending_urls:
+                pending_urls, cached = result_cache.partition(pending_urls)
+                print(f"Incremental run: {len(cached)} URL(s) served from cache, {len(pending_urls)} to process")
+
+            # Shards inherit the run id, so every process records results under this run
+            history = HistoryStore.get_shared() if config["history_enabled"] else None
+            run_id = history.start_run(Configuration.get_run_profile()["name"]) if history else None
+            if history:
+                for url, row_number in excel_urls:
+                    if row_number in cached:
+                        history.add(row_number, url, cached[row_number], run_id=run_id)
+
+            # Process URLs across shards and workers; results come back in row order
+            new_results = []
+            if pending_urls and config["run_mode"] == "status_only":
+                new_results = AsyncStatusChecker.run(pending_urls)
+                if history:
+                    for (url, row_number), result in zip(pending_urls, new_results):
+                        history.add(row_number, url, result, run_id=run_id)
+            elif pending_urls:
+                new_results = ShardRunner.run(pending_urls)
+
+            if streaming:
+                # Results produced outside the browser workers join the journal too
+                journal = RunJournal.get_shared()
+                for url, row_number in excel_urls:
+                    if row_number in cached:
+                        journal.append(row_number, url, cached[row_number])
+                for (url, row_number), result in zip(pending_urls, new_results):
+                    journal.append(row_number, url, result)
+                journal.sync()
+                new_results = ResultSink(journal_dir, pending_urls)
+
+            if result_cache:
+                result_cache.update(pending_urls, new_results)
+                result_cache.save()
+            if streaming:
+                results = ResultSink(journal_dir, excel_urls)
+            else:
+                results = RunJournal.merge(excel_urls, {**journaled, **cached}, new_results)
+
+            # One pass over the results for counters, error lists and stage aggregates;
+            # only the two report writers read them again
+            successful = failed = unrecorded = 0
+            failed_urls, critical_errors, network_errors = [], [], []
+            stage_profile = StageAggregator()
+            critical_markers = [
+                'connection refused',
+                'internal server error',
+                'fatal error',
+                'chrome crashed',
+                'session not created'
+            ]
+            network_markers = [
+                'err_name_not_resolved',
+                'dns',
+                'timeout',
+                'net::err_',
+                'network unreachable'
+            ]
+            if streaming:
+                records = results.records()
+            else:
+                records = ((url, row_number, result) for (url, row_number), result in zip(excel_urls, results))
+
+            for url, row_number, result in records:
+                if result is None:
+                    unrecorded += 1
+                    result = ResultSink.missing_result(url)
+                stage_profile.add(result)
+                error = str(result['error']).lower() if result.get('error') else ''
+                # Check for truly critical errors (excluding DNS and common network issues)
+                if error and any(marker in error for marker in critical_markers):
+                    critical_errors.append((url, result['error']))
+                # Log DNS and network-related issues separately
+                if error and any(marker in error for marker in network_markers):
+                    network_errors.append((url, result['error']))
+
                 with allure.step(f"Processing URL {row_number - 1} of {total_urls}: {url}"):
-                    print(f"\nProcessing URL {row_number - 1} of {total_urls}: {url}")
-
-                    try:
-                        # Process URL and get result
-                        result = WebAutomation.process_url(url, row_number - 1)
-
-                        # Calculate processing time if not set
-                        if not result.get('load_time'):
-                            url_end_time = current_time()
-                            result['load_time'] = (url_end_time - url_start_time) * 1000
-
-                        results.append(result)
-
-                        # Update counters
-                        if result['status'] == 'Success':
-                            successful += 1
-                        else:
-                            failed += 1
-
-                        # Add detailed Allure report
-                        allure.attach(
-                            body=f"""
-                            URL: {url}
-                            Status: {result['status']}
-                            Error: {result.get('error', 'None')}
-                            Load Time: {result.get('load_time', 0):.2f}ms
-                            Screenshot: {'Captured' if result.get('screenshot') else 'Failed'}
-                            """,
-                            name=f"URL Test Result {row_number - 1}",
-                            attachment_type=allure.attachment_type.TEXT
-                        )
-
-                        # Attach screenshot to Allure if available
-                        if result.get('screenshot') and os.path.exists(result['screenshot']):
-                            with open(result['screenshot'], 'rb') as screenshot:
-                                allure.attach(
-                                    screenshot.read(),
-                                    name=f"Screenshot_{row_number - 1}",
-                                    attachment_type=allure.attachment_type.PNG
-                                )
-
-                    except Exception as e:
-                        error_msg = f"Error processing URL {url}: {str(e)}"
-                        print(error_msg)
-                        allure.attach(
-                            body=error_msg,
-                            name=f"URL Processing Error {row_number - 1}",
-                            attachment_type=allure.attachment_type.TEXT
-                        )
-                        # Add failed result
-                        results.append({
-                            'url': url,
-                            'status': 'Failed',
-                            'error': str(e),
-                            'load_time': (current_time() - url_start_time) * 1000,
-                            'start_time': url_start_time,
-                            'end_time': current_time()
-                        })
+                    # Update counters
+                    if result['status'] == 'Success':
+                        successful += 1
+                    else:
                         failed += 1
+                    if result['status'] == 'Failed':
+                        failed_urls.append((url, result.get('error', 'Unknown error')))
+
+                    # Add detailed Allure report
+                    allure.attach(
+                        body=f"""
+                        URL: {url}
+                        Status: {result['status']}
+                        Error: {result.get('error', 'None')}
+                        Load Time: {result.get('load_time', 0):.2f}ms
+                        Screenshot: {'Captured' if result.get('screenshot') else 'Failed'}
+                        """,
+                        name=f"URL Test Result {row_number - 1}",
+                        attachment_type=allure.attachment_type.TEXT
+                    )
 
-                    # Wait between URLs if not the last URL
-                    if row_number < total_urls:
-                        wait_time = Configuration.get_config()["wait_between_urls"]
-                        print(f"Waiting {wait_time} seconds before next URL...")
-                        time.sleep(wait_time)
+            if history:
+                history.finish_run(run_id, total=successful + failed, passed=successful)
 
             # Calculate total execution time
             execution_time = (current_time() - execution_start_time) * 1000
@@ -170,13 +226,13 @@ class TestURLProcessor:
             Test Execution Summary:
             Start Time: {test_start_time.strftime('%Y-%m-%d %H:%M:%S')}
             Total Execution Time: {execution_time:.2f}ms
-            Total URLs processed: {len(results)}
+            Total URLs processed: {successful + failed}
             Successfully loaded: {successful}
             Failed to load: {failed}
-            Success rate: {(successful / len(results) * 100 if results else 0):.2f}%
+            Success rate: {(successful / (successful + failed) * 100 if successful + failed else 0):.2f}%
 
             Failed URLs:
-            {self._format_failed_urls(results)}
+            {self._format_failed_urls(failed_urls)}
             """
             print("\n" + summary)
 
@@ -193,6 +249,13 @@ class TestURLProcessor:
             except Exception as e:
                 print(f"Error generating HTML report: {str(e)}")
 
+            try:
+                profile_path = Profiler.write_summary(stage_profile)
+                if profile_path:
+                    print(f"\nStage profile generated: {profile_path}")
+            except Exception as e:
+                print(f"Error writing stage profile: {str(e)}")
+
             # Attach summary to Allure report
             allure.attach(
                 body=summary,
@@ -201,36 +264,12 @@ class TestURLProcessor:
             )
 
             # Add assertions for test validation
-            assert len(results) == total_urls, "All URLs should be processed"
-
-            # Check for truly critical errors (excluding DNS and common network issues)
-            critical_errors = [r for r in results if r.get('error') and any(
-                critical in str(r['error']).lower()
-                for critical in [
-                    'connection refused',
-                    'internal server error',
-                    'fatal error',
-                    'chrome crashed',
-                    'session not created'
-                ]
-            )]
-
-            # Log DNS and network-related issues separately
-            network_errors = [r for r in results if r.get('error') and any(
-                network_error in str(r['error']).lower()
-                for network_error in [
-                    'err_name_not_resolved',
-                    'dns',
-                    'timeout',
-                    'net::err_',
-                    'network unreachable'
-                ]
-            )]
+            assert not unrecorded and successful + failed == total_urls, "All URLs should be processed"
 
             if network_errors:
                 network_summary = "\n".join(
-                    f"- {r['url']}: {r['error']}"
-                    for r in network_errors
+                    f"- {url}: {error}"
+                    for url, error in network_errors
                 )
                 allure.attach(
                     body=f"Network/DNS Issues Found:\n{network_summary}",
@@ -241,8 +280,8 @@ class TestURLProcessor:
 
             if critical_errors:
                 critical_summary = "\n".join(
-                    f"- {r['url']}: {r['error']}"
-                    for r in critical_errors
+                    f"- {url}: {error}"
+                    for url, error in critical_errors
                 )
                 allure.attach(
                     body=f"Critical Errors Found:\n{critical_summary}",
@@ -261,15 +300,14 @@ class TestURLProcessor:
             )
             raise
 
-    def _format_failed_urls(self, results):
-        """Format failed URLs for summary report"""
-        failed_urls = [r for r in results if r['status'] == 'Failed']
+    def _format_failed_urls(self, failed_urls):
+        """Format failed (url, error) pairs for summary report"""
         if not failed_urls:
             return "None"
 
         return "\n".join(
-            f"- {r['url']}: {r.get('error', 'Unknown error')}"
-            for r in failed_urls
+            f"- {url}: {error}"
+            for url, error in failed_urls
         )
 
 
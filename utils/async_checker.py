@@ -0,0 +1,180 @@
+# utils/async_checker.py
+import asyncio
+import ssl
+from time import time
+from urllib.parse import urljoin, urlsplit
+from .config_handler import Configuration
+from .error_patterns import ERROR_MAPPINGS, classify_network_error, format_http_error
+from .result_record import ResultRecord, StepRecord, StepStatus
+from .url_handler import URLHandler
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class AsyncStatusChecker:
+    """Status-only URL checker running thousands of requests on one event loop"""
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    def __init__(self, concurrency=200, per_host_limit=4, timeout=10, max_redirects=5):
+        self.concurrency = max(1, int(concurrency))
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._semaphore = None
+        self._host_semaphores = {}
+
+        # Chrome runs with --ignore-certificate-errors, so certificates are not verified here either
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    @classmethod
+    def from_config(cls):
+        """Create a checker from config.json settings"""
+        config = Configuration.get_config()
+        return cls(
+            concurrency=config["async_concurrency"],
+            per_host_limit=config["async_per_host_limit"],
+            timeout=config["async_timeout"]
+        )
+
+    def _host_semaphore(self, host):
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def _request(self, url, timing):
+        """Send a GET and return (status_code, headers) without reading the body.
+
+        Time spent in the exchange, excluding the wait for a connection slot,
+        is added to ``timing['elapsed']``; ``timing['start']`` is when the
+        first exchange began.
+        """
+        parts = urlsplit(url)
+        use_ssl = parts.scheme == "https"
+        host = parts.hostname
+        port = parts.port or (443 if use_ssl else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        async with self._host_semaphore(f"{host}:{port}"):
+            # Only the exchange is timed; waiting behind other requests to the host is neither
+            # a timeout nor part of the load time
+            started = time()
+            if timing['start'] is None:
+                timing['start'] = started
+            try:
+                return await asyncio.wait_for(self._exchange(host, port, use_ssl, parts.netloc, path),
+                                              self.timeout)
+            finally:
+                timing['elapsed'] += time() - started
+
+    async def _exchange(self, host, port, use_ssl, netloc, path):
+        """Connect, send the GET and read the status line and headers"""
+        reader, writer = await asyncio.open_connection(
+            host, port,
+            ssl=self._ssl_context if use_ssl else None,
+            server_hostname=host if use_ssl else None
+        )
+        try:
+            writer.write(
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {netloc}\r\n"
+                f"User-Agent: {self.USER_AGENT}\r\n"
+                "Accept: */*\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1")
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("Server returned empty response")
+            status_code = int(status_line.split()[1])
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            return status_code, headers
+        finally:
+            writer.close()
+
+    async def _fetch(self, url, timing):
+        """Follow redirects and return (status_code, final_url, redirect_count)"""
+        redirects = 0
+        while True:
+            status_code, headers = await self._request(url, timing)
+            if status_code not in REDIRECT_STATUSES or "location" not in headers:
+                return status_code, url, redirects
+            if redirects >= self.max_redirects:
+                return status_code, url, redirects
+            url = urljoin(url, headers["location"])
+            redirects += 1
+
+    async def check_url(self, url):
+        """Check a single URL and return a result dict shaped like process_url's"""
+        timing = {'start': None, 'elapsed': 0}
+        result = ResultRecord(
+            url=url,
+            status='Failed',
+            load_time=0,
+            screenshot=None,
+            error=None,
+            start_time=time(),
+            steps=[StepRecord(StepStatus.INFO, f"Starting status check for URL: {url}")]
+        )
+
+        async with self._semaphore:
+            try:
+                status_code, final_url, redirects = await self._fetch(URLHandler.format_url(url), timing)
+                result['status_code'] = status_code
+                result['final_url'] = final_url
+
+                if status_code >= 400:
+                    result['error'] = format_http_error(status_code)
+                    result['steps'].append(StepRecord(StepStatus.FAIL, f"Status check failed: {result['error']}"))
+                else:
+                    result['status'] = 'Success'
+                    result['steps'].append(StepRecord(
+                        StepStatus.SUCCESS,
+                        f"HTTP {status_code} after {redirects} redirect(s)"
+                    ))
+
+            except asyncio.TimeoutError:
+                result['error'] = ERROR_MAPPINGS['ERR_CONNECTION_TIMED_OUT']
+            except ssl.SSLError as e:
+                result['error'] = f"{ERROR_MAPPINGS['ERR_SSL_PROTOCOL_ERROR']}: {str(e)}"
+            except Exception as e:
+                error_code = classify_network_error(e)
+                result['error'] = ERROR_MAPPINGS[error_code] if error_code else f"Error: {str(e)}"
+
+            if result['status'] != 'Success' and len(result['steps']) == 1:
+                result['steps'].append(StepRecord(StepStatus.FATAL, f"Error: {result['error']}"))
+
+        result['end_time'] = time()
+        if timing['start'] is not None:
+            result['start_time'] = timing['start']
+        result['load_time'] = timing['elapsed'] * 1000
+        return result
+
+    async def check_all(self, urls):
+        """Check (url, row_number) pairs concurrently and return results in the same order"""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_semaphores = {}
+        return await asyncio.gather(*(self.check_url(url) for url, _ in urls))
+
+    @staticmethod
+    def run(urls, checker=None):
+        """Run a status-only check of (url, row_number) pairs"""
+        checker = checker or AsyncStatusChecker.from_config()
+        print(f"Status-checking {len(urls)} URLs with up to {checker.concurrency} concurrent requests")
+        return asyncio.run(checker.check_all(urls))
@@ -0,0 +1,99 @@
+# utils/circuit_breaker.py
+import re
+import threading
+from time import monotonic
+from .config_handler import Configuration
+from .error_patterns import ERROR_MAPPINGS
+
+# Failures that say the host itself is unreachable, as opposed to an error page it served
+CONNECTION_ERROR_CODES = (
+    'ERR_NAME_NOT_RESOLVED', 'ERR_CONNECTION_REFUSED', 'ERR_CONNECTION_TIMED_OUT',
+    'ERR_NETWORK_UNREACHABLE', 'ERR_CONNECTION_RESET', 'ERR_EMPTY_RESPONSE'
+)
+CONNECTION_ERROR_REGEX = re.compile(
+    "|".join(
+        [re.escape(code) for code in CONNECTION_ERROR_CODES]
+        + [re.escape(ERROR_MAPPINGS[code]) for code in CONNECTION_ERROR_CODES]
+        + [r"ERR_ADDRESS_UNREACHABLE", r"ERR_TIMED_OUT", r"page load timeout", r"timed out receiving message"]
+    ),
+    re.IGNORECASE
+)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker.
+
+    After ``failure_threshold`` consecutive connection-class failures a host's
+    circuit opens and its remaining URLs are rejected without a browser. Once
+    ``cooldown`` seconds have passed, one URL is let through as a half-open
+    probe: success closes the circuit, another connection failure reopens it.
+    """
+
+    def __init__(self, failure_threshold=3, cooldown=60):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        config = Configuration.get_config()
+        return cls(
+            failure_threshold=config["circuit_failure_threshold"],
+            cooldown=config["circuit_cooldown"]
+        )
+
+    @staticmethod
+    def is_connection_failure(result):
+        if result.get('status') == 'Success' or not result.get('error'):
+            return False
+        return bool(CONNECTION_ERROR_REGEX.search(str(result['error'])))
+
+    def allow(self, host):
+        """Check whether a URL for the host may be processed now"""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit['state'] == CLOSED:
+                return True
+            if circuit['state'] == OPEN and monotonic() - circuit['opened_at'] >= self.cooldown:
+                # The caller becomes the half-open probe; others keep failing fast until it reports
+                circuit['state'] = HALF_OPEN
+                print(f"Circuit half-open for {host}; probing")
+                return True
+            return False
+
+    def record(self, host, result):
+        """Update the host's circuit with a processed result"""
+        failure = self.is_connection_failure(result)
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if not failure:
+                if circuit and circuit['state'] != CLOSED:
+                    print(f"Circuit closed for {host}")
+                # A healthy host needs no state; keeps memory bounded on large lists
+                self._circuits.pop(host, None)
+                return
+
+            if circuit is None:
+                circuit = self._circuits[host] = {'state': CLOSED, 'failures': 0, 'opened_at': 0}
+            circuit['failures'] += 1
+            if circuit['state'] == HALF_OPEN or circuit['failures'] >= self.failure_threshold:
+                if circuit['state'] != OPEN:
+                    print(f"Circuit open for {host} after {circuit['failures']} consecutive "
+                          f"connection failure(s)")
+                circuit['state'] = OPEN
+                circuit['opened_at'] = monotonic()
+
+    def state(self, host):
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return circuit['state'] if circuit else CLOSED
+
+    def failures(self, host):
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return circuit['failures'] if circuit else 0
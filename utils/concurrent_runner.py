@@ -0,0 +1,217 @@
+# utils/concurrent_runner.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import time, monotonic
+from .circuit_breaker import CircuitBreaker
+from .config_handler import Configuration
+from .dns_resolver import DNSResolver
+from .error_patterns import ERROR_MAPPINGS
+from .history_store import HistoryStore
+from .host_scheduler import HostScheduler
+from .latency_history import LatencyHistory
+from .result_record import ResultRecord, StepRecord, StepStatus
+from .retry_policy import RetryPolicy
+from .run_journal import RunJournal
+from .url_handler import URLHandler
+from .web_handler import WebAutomation
+
+
+class ConcurrentRunner:
+    @staticmethod
+    def build_failed_result(url, error, start_time):
+        """Build a failed result for a URL whose processing raised"""
+        end_time = time()
+        return ResultRecord(
+            url=url,
+            status='Failed',
+            error=str(error),
+            load_time=(end_time - start_time) * 1000,
+            start_time=start_time,
+            end_time=end_time
+        )
+
+    @staticmethod
+    def process_one(url, row_number, process_func):
+        """Process a single URL on a worker thread"""
+        url_start_time = time()
+        try:
+            result = process_func(url, row_number - 1)
+
+            # Calculate processing time if not set
+            if not result.get('load_time'):
+                result['load_time'] = (time() - url_start_time) * 1000
+        except Exception as e:
+            print(f"Error processing URL {url}: {str(e)}")
+            result = ConcurrentRunner.build_failed_result(url, e, url_start_time)
+        return result
+
+    @staticmethod
+    def build_dns_failed_result(url, host):
+        """Fail a URL whose host has no DNS records without starting a browser"""
+        result = ConcurrentRunner.build_failed_result(url, ERROR_MAPPINGS['ERR_NAME_NOT_RESOLVED'], time())
+        result['load_time'] = 0
+        result['attempts'] = 0
+        result['steps'] = [StepRecord(StepStatus.FAIL, f"DNS pre-resolution found no records for {host}")]
+        return result
+
+    @staticmethod
+    def build_circuit_open_result(url, host, failures):
+        """Fail a URL fast because its host's circuit breaker is open"""
+        error = f"Circuit open for {host} after {failures} consecutive connection failure(s)"
+        result = ConcurrentRunner.build_failed_result(url, error, time())
+        result['load_time'] = 0
+        result['circuit_open'] = True
+        result['host'] = host
+        result['steps'] = [StepRecord(StepStatus.FAIL, f"Skipped without opening a browser: {error}")]
+        return result
+
+    @staticmethod
+    def attempt_record(attempt, result, retry_delay):
+        """Summarise a failed attempt that is going to be retried"""
+        return {
+            'attempt': attempt,
+            'error': result.get('error'),
+            'duration': result.get('load_time', 0),
+            'retry_delay': retry_delay,
+            'timestamp': monotonic()
+        }
+
+    @staticmethod
+    def merge_attempts(result, attempt, attempts):
+        """Record earlier attempts and their timing in the final result's steps"""
+        result['attempts'] = attempt
+        if not attempts:
+            return result
+
+        retry_steps = [StepRecord(
+            StepStatus.RETRY,
+            f"Attempt {record['attempt']} failed after {record['duration']:.2f}ms: "
+            f"{record['error']}; retried after {record['retry_delay']:.1f}s",
+            record['timestamp']
+        ) for record in attempts]
+        retry_steps.append(StepRecord(
+            StepStatus.INFO,
+            f"Attempt {attempt} finished in {result.get('load_time', 0):.2f}ms"
+        ))
+        result['steps'] = retry_steps + result.get('steps', [])
+        return result
+
+    @staticmethod
+    def run(urls, max_workers=None, process_func=None, keep_results=None):
+        """Process (url, row_number) pairs on a pool of browser workers.
+
+        Workers pull URLs from a per-host scheduler, so each host is paced
+        by host_min_interval/host_max_in_flight while other hosts proceed.
+        Hosts are pre-resolved in bulk so dead domains fail without a browser.
+        Transient failures are requeued with backoff up to max_retries times,
+        and hosts whose circuit breaker is open fail fast without a browser.
+        Results are returned in the same order as ``urls``. With
+        ``keep_results=False`` (the default when stream_results is on) they
+        are only written to the run journal and an empty list is returned.
+        """
+        config = Configuration.get_config()
+        max_workers = max(1, int(max_workers or config["max_workers"]))
+        process_func = process_func or WebAutomation.process_url
+        if keep_results is None:
+            keep_results = not config["stream_results"]
+        total_urls = len(urls)
+        results = [None] * total_urls
+        progress = {'completed': 0}
+        progress_lock = threading.Lock()
+
+        scheduler = HostScheduler(
+            min_interval=config["host_min_interval"],
+            max_in_flight=config["host_max_in_flight"]
+        )
+        retry_policy = RetryPolicy.from_config()
+        breaker = CircuitBreaker.from_config() if config["circuit_breaker_enabled"] else None
+        # Streamed results exist only in the journal, so it is always written then
+        journal = RunJournal.get_shared() if config["journal_enabled"] or not keep_results else None
+        history = HistoryStore.get_shared() if config["history_enabled"] else None
+        run_id = history.current_run_id() if history else None
+        # Called outside a run started by the caller (or the parent shard), this call is the run
+        owns_run = bool(history) and run_id is None
+        if owns_run:
+            run_id = history.start_run(Configuration.get_run_profile()["name"], export=False)
+        hosts = [URLHandler.extract_host_from_url(url) for url, _ in urls]
+
+        def record(url, row_number, result):
+            if journal:
+                journal.append(row_number, url, result)
+            if history:
+                history.add(row_number, url, result, run_id=run_id)
+
+        def complete(index, url, row_number, result):
+            if keep_results:
+                results[index] = result
+            if journal or history:
+                # Record once screenshots are written so the record has their final paths
+                WebAutomation.when_screenshots_written(result, lambda: record(url, row_number, result))
+
+        dns_answers = {}
+        if config["dns_prefetch_enabled"] and hosts:
+            resolver = DNSResolver.get_shared()
+            dns_answers = resolver.resolve_all(hosts)
+            print(f"Pre-resolved {len(dns_answers)} unique host(s)")
+
+        for index, ((url, row_number), host) in enumerate(zip(urls, hosts)):
+            if dns_answers and resolver.is_unresolvable(dns_answers, host):
+                result = ConcurrentRunner.build_dns_failed_result(url, host)
+                complete(index, url, row_number, result)
+                progress['completed'] += 1
+                print(f"Completed {progress['completed']} of {total_urls}: {url} [Failed - DNS]")
+                continue
+            scheduler.add((index, url, row_number, 1, []), host)
+
+        def worker():
+            while True:
+                job = scheduler.get()
+                if job is None:
+                    return
+                host, (index, url, row_number, attempt, attempts) = job
+                paced = True
+                try:
+                    if breaker and not breaker.allow(host):
+                        # Nothing is sent to the host, so its next URL need not wait either
+                        paced = False
+                        result = ConcurrentRunner.build_circuit_open_result(url, host, breaker.failures(host))
+                    else:
+                        result = ConcurrentRunner.process_one(url, row_number, process_func)
+                        if breaker:
+                            breaker.record(host, result)
+
+                        if retry_policy.should_retry(result, attempt):
+                            # Requeue at the back instead of sleeping, so this worker moves on
+                            delay = retry_policy.get_delay(attempt)
+                            attempts.append(ConcurrentRunner.attempt_record(attempt, result, delay))
+                            print(f"Transient failure for {url} (attempt {attempt}): {result['error']}; "
+                                  f"retrying in {delay:.1f}s")
+                            scheduler.add((index, url, row_number, attempt + 1, attempts), host,
+                                          not_before=monotonic() + delay)
+                            continue
+                    # A short-circuited attempt was never made
+                    attempts_made = attempt if paced else attempt - 1
+                    result = ConcurrentRunner.merge_attempts(result, attempts_made, attempts)
+                    complete(index, url, row_number, result)
+                finally:
+                    scheduler.done(host, paced=paced)
+
+                with progress_lock:
+                    progress['completed'] += 1
+                    print(f"Completed {progress['completed']} of {total_urls}: {url} "
+                          f"[{result['status']}]")
+
+        print(f"Processing {total_urls} URLs with {max_workers} worker(s)")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="url-worker") as executor:
+            for future in [executor.submit(worker) for _ in range(max_workers)]:
+                future.result()
+
+        # Screenshots are written in the background; make sure they are on disk before reporting
+        WebAutomation.flush_screenshot_sink()
+        LatencyHistory.save_shared()
+        RunJournal.sync_shared()
+        HistoryStore.flush_shared()
+        if owns_run:
+            history.finish_run(run_id)
+        return results if keep_results else []
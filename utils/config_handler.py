@@ -2,25 +2,53 @@
 import os
 import json
 import shutil
+import threading
 import allure
 from datetime import datetime
 
+# Browser run profiles selectable with "run_profile" in config.json
+RUN_PROFILES = {
+    "headed": {"headless": False, "window_size": None, "page_load_strategy": "normal"},
+    "headless": {"headless": True, "window_size": "1366,768", "page_load_strategy": "normal"},
+    "headless-eager": {"headless": True, "window_size": "1366,768", "page_load_strategy": "eager"},
+    "headless-none": {"headless": True, "window_size": "1366,768", "page_load_strategy": "none"}
+}
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
+
 
 class Configuration:
+    # Combined configuration, rebuilt only when config.json changes
+    _config = None
+    _config_mtime = None
+    _config_lock = threading.Lock()
+
     @staticmethod
     def load_config():
         """Load configuration from config.json"""
-        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
         try:
-            with open(config_path, 'r') as f:
+            with open(CONFIG_PATH, 'r') as f:
                 return json.load(f)
         except Exception as e:
             print(f"Error loading config file: {str(e)}")
             return {}
 
+    @classmethod
+    def get_config(cls):
+        """Get combined configuration with defaults; config.json is re-read only after it changes"""
+        try:
+            mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        except OSError:
+            mtime = None
+        with cls._config_lock:
+            if cls._config is None or mtime != cls._config_mtime:
+                cls._config, cls._config_mtime = cls.build_config(), mtime
+            return dict(cls._config)
+
     @staticmethod
-    def get_config():
-        """Get combined configuration with defaults"""
+    def build_config():
+        """Read config.json and combine it with the defaults"""
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
         # Load custom config
@@ -40,18 +68,98 @@ class Configuration:
             "logs_dir": os.path.join(project_root, "logs"),
             "output_excel_dir": os.path.join(project_root, "reports", "Output-Excel"),
             "backup_excel_dir": os.path.join(project_root, "reports", "Backup-Excel"),
+            "latency_history_file": os.path.join(project_root, "reports", "latency_history.json"),
+            "journal_dir": os.path.join(project_root, "reports", "journal"),
+            "result_cache_file": os.path.join(project_root, "reports", "result_cache.json"),
+            "history_db": os.path.join(project_root, "reports", "history.sqlite3"),
             "chrome_driver_path": custom_config.get("chrome_driver_path", ""),
             "sheet_name": "Sheet1",
             "page_load_timeout": 60,
             "max_retries": 2,
             "retry_delay": 2,
-            "wait_between_urls": 2
+            "retry_backoff_factor": 2,
+            "retry_max_delay": 60,
+            "host_min_interval": 2,
+            "host_max_in_flight": 1,
+            "driver_pool_size": 1,
+            "driver_max_uses": 50,
+            "driver_acquire_timeout": 300,
+            "max_workers": 1,
+            "shard_count": 1,
+            "preflight_enabled": True,
+            "preflight_timeout": 10,
+            "capture_screenshots": True,
+            "run_mode": "browser",
+            "async_concurrency": 200,
+            "async_per_host_limit": 4,
+            "async_timeout": 10,
+            "readiness_quiet_ms": 500,
+            "readiness_max_quiet_wait": 10,
+            "error_scan_chars": 20000,
+            "screenshot_writer_threads": 2,
+            "screenshot_queue_size": 32,
+            "screenshot_format": "png",
+            "screenshot_quality": 80,
+            "screenshot_max_width": None,
+            "keep_full_screenshot": True,
+            "thumbnail_max_width": 480,
+            "thumbnail_format": "jpeg",
+            "thumbnail_quality": 60,
+            "report_screenshot": "thumbnail",
+            "screenshot_dedup": True,
+            "screenshot_near_duplicates": False,
+            "screenshot_phash_threshold": 2,
+            "resource_blocking": "off",
+            "blocked_url_patterns": [],
+            "run_profile": "headed",
+            "headless": None,
+            "window_size": None,
+            "page_load_strategy": None,
+            "dns_prefetch_enabled": True,
+            "dns_cache_ttl": 300,
+            "dns_negative_ttl": 60,
+            "dns_concurrency": 32,
+            "dns_timeout": 5,
+            "profiling_enabled": True,
+            "adaptive_timeouts_enabled": True,
+            "adaptive_timeout_factor": 3,
+            "adaptive_timeout_min": 10,
+            "adaptive_timeout_max": 60,
+            "latency_min_samples": 5,
+            "latency_max_samples": 100,
+            "circuit_breaker_enabled": True,
+            "circuit_failure_threshold": 3,
+            "circuit_cooldown": 60,
+            "journal_enabled": True,
+            "journal_fsync_batch": 20,
+            "journal_fsync_interval": 2,
+            "incremental_enabled": False,
+            "result_cache_ttl": 86400,
+            "result_cache_revalidate": True,
+            "result_cache_concurrency": 16,
+            "history_enabled": True,
+            "history_batch_size": 50,
+            "stream_results": True
         }
 
         # Update default config with custom config
         default_config.update(custom_config)
         return default_config
 
+    @staticmethod
+    def get_run_profile():
+        """Get the browser run profile, with any explicit overrides from config.json"""
+        config = Configuration.get_config()
+        name = config["run_profile"]
+        if name not in RUN_PROFILES:
+            raise ValueError(f"Unknown run profile: {name}")
+
+        profile = dict(RUN_PROFILES[name], name=name)
+        for key in ("headless", "window_size", "page_load_strategy"):
+            if config.get(key) is not None:
+                profile[key] = config[key]
+        return profile
+
     @staticmethod
     def get_path(path_name):
         """Get specific path from configuration"""
@@ -0,0 +1,136 @@
+# utils/dns_resolver.py
+import queue
+import socket
+import threading
+from collections import deque
+from time import monotonic
+from urllib.parse import urlparse
+from .config_handler import Configuration
+
+# Temporary resolver errors; the host is left for the browser to try instead of failing it
+TRANSIENT_DNS_ERRORS = tuple(
+    getattr(socket, name) for name in ('EAI_AGAIN', 'EAI_SYSTEM') if hasattr(socket, name)
+)
+
+
+class DNSResolver:
+    """Bulk host resolver with a TTL cache of positive and negative answers.
+
+    ``resolver`` is called as ``resolver(host)`` and should return a list of
+    addresses or raise ``socket.gaierror``; it defaults to getaddrinfo.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, resolver=None, positive_ttl=300, negative_ttl=60, concurrency=32, timeout=5):
+        self.resolver = resolver or self.system_resolve
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Get the process-wide resolver configured from config.json"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                config = Configuration.get_config()
+                cls._shared = cls(
+                    positive_ttl=config["dns_cache_ttl"],
+                    negative_ttl=config["dns_negative_ttl"],
+                    concurrency=config["dns_concurrency"],
+                    timeout=config["dns_timeout"]
+                )
+            return cls._shared
+
+    @staticmethod
+    def system_resolve(host):
+        return sorted({info[4][0] for info in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)})
+
+    @staticmethod
+    def hostname(host):
+        """Strip credentials, port and IPv6 brackets from a URL host"""
+        return (urlparse(f"//{host}").hostname or host).rstrip(".").lower()
+
+    def _cached(self, host):
+        with self._lock:
+            entry = self._cache.get(host)
+            if entry and entry['expires'] > monotonic():
+                return entry
+            self._cache.pop(host, None)
+            return None
+
+    def _lookup(self, host):
+        """Resolve one host and cache the answer; None means the outcome is unknown"""
+        try:
+            entry = {'resolved': True, 'addresses': list(self.resolver(host)), 'error': None}
+            ttl = self.positive_ttl
+        except socket.gaierror as e:
+            if e.errno in TRANSIENT_DNS_ERRORS:
+                return None
+            entry = {'resolved': False, 'addresses': [], 'error': str(e)}
+            ttl = self.negative_ttl
+        except Exception as e:
+            print(f"Error resolving {host}: {str(e)}")
+            return None
+
+        entry['expires'] = monotonic() + ttl
+        with self._lock:
+            self._cache[host] = entry
+        return entry
+
+    def resolve(self, host):
+        """Resolve a single host, using the cache when the answer is still fresh"""
+        host = self.hostname(host)
+        return self._cached(host) or self._lookup(host)
+
+    def resolve_all(self, hosts):
+        """Resolve unique hosts concurrently.
+
+        Returns a dict of hostname -> entry; hosts whose lookup failed
+        temporarily or ran longer than ``timeout`` map to None. The timeout
+        applies to each lookup from when it starts, not to the whole batch.
+        """
+        answers = {}
+        queued = deque()
+        for host in {self.hostname(host) for host in hosts if host}:
+            entry = self._cached(host)
+            if entry:
+                answers[host] = entry
+            else:
+                queued.append(host)
+
+        completed = queue.Queue()
+        running = {}
+
+        def lookup(host):
+            completed.put((host, self._lookup(host)))
+
+        while queued or running:
+            while queued and len(running) < self.concurrency:
+                host = queued.popleft()
+                running[host] = monotonic()
+                # Daemon threads: a hung lookup is abandoned and must not hold up the run
+                threading.Thread(target=lookup, args=(host,), name=f"dns-{host}", daemon=True).start()
+
+            try:
+                wait = min(running.values()) + self.timeout - monotonic()
+                host, entry = completed.get(timeout=max(0, wait))
+                if running.pop(host, None) is not None:
+                    answers[host] = entry
+            except queue.Empty:
+                now = monotonic()
+                for host, started in list(running.items()):
+                    if now - started >= self.timeout:
+                        # Its slot is freed for the next lookup; a late answer still lands in the cache
+                        del running[host]
+                        answers[host] = None
+        return answers
+
+    def is_unresolvable(self, answers, host):
+        """True only when the host has a cached negative answer"""
+        entry = answers.get(self.hostname(host))
+        return entry is not None and not entry['resolved']
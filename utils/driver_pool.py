@@ -0,0 +1,166 @@
+# utils/driver_pool.py
+import threading
+from time import time
+from urllib.parse import urlsplit
+import allure
+
+
+class DriverPool:
+    """Pool of reusable Chrome drivers shared across URL checks"""
+
+    def __init__(self, factory, size=1, max_uses=50, acquire_timeout=300):
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.acquire_timeout = acquire_timeout
+        self._idle = []
+        self._uses = {}
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def is_healthy(driver):
+        """Check that the browser session still responds"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def origin_of(url):
+        parts = urlsplit(url)
+        if not parts.scheme.startswith("http") or not parts.hostname:
+            return None
+        port = f":{parts.port}" if parts.port else ""
+        return f"{parts.scheme}://{parts.hostname}{port}"
+
+    @staticmethod
+    def reset_driver(driver, visited=()):
+        """Clear cookies and storage so the next URL starts from a clean profile.
+
+        Storage is cleared for the current page's origin and the origin of
+        every URL in ``visited``. Raises when it cannot be cleared, so the
+        pool recycles the browser instead of reusing dirty storage.
+        """
+        origins = {DriverPool.origin_of(url) for url in visited}
+        try:
+            origins.add(driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+                "return location.origin;"
+            ))
+        except Exception:
+            pass
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        # IndexedDB, cache storage and service workers are kept per origin; there is no wildcard
+        for origin in origins:
+            if origin and origin != "null":
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": origin,
+                    "storageTypes": "all"
+                })
+
+        driver.get("about:blank")
+
+    def _forget(self, driver):
+        """Free a driver's slot in the pool; call with the lock held"""
+        self._uses.pop(driver, None)
+        self._created -= 1
+        self._condition.notify()
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error closing pooled browser: {str(e)}")
+
+    def acquire(self):
+        """Get a healthy driver from the pool, creating one if a slot is free.
+
+        Health checks and quitting dead browsers happen outside the lock,
+        so one hung browser never blocks other workers.
+        """
+        deadline = time() + self.acquire_timeout
+        while True:
+            driver = None
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool has been shut down")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        break
+
+                    remaining = deadline - time()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No browser available in pool after {self.acquire_timeout}s")
+                    self._condition.wait(remaining)
+
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                return driver
+            print("Discarding unresponsive browser from pool")
+            with self._condition:
+                self._forget(driver)
+            self._quit(driver)
+
+        # Launch outside the lock so other workers are not blocked by Chrome startup
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._uses[driver] = 0
+        return driver
+
+    def release(self, driver, visited=()):
+        """Return a driver to the pool, recycling it once it reaches max_uses"""
+        with self._condition:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            recycle = self._closed or self._uses[driver] >= self.max_uses
+
+        if not recycle:
+            try:
+                self.reset_driver(driver, visited)
+            except Exception as e:
+                print(f"Error resetting browser, recycling it: {str(e)}")
+                recycle = True
+
+        with self._condition:
+            if recycle:
+                self._forget(driver)
+            else:
+                self._idle.append(driver)
+                self._condition.notify()
+        if recycle:
+            self._quit(driver)
+
+    def close(self):
+        """Quit all idle drivers; drivers still in use are quit on release"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._forget(driver)
+            self._condition.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+        if idle:
+            allure.attach(
+                body=f"Closed {len(idle)} pooled browser(s)",
+                name="Driver Pool Shutdown",
+                attachment_type=allure.attachment_type.TEXT
+            )
@@ -0,0 +1,89 @@
+# utils/error_patterns.py
+import errno
+import re
+import socket
+
+# Text patterns that indicate an HTTP error page, keyed by status code
+ERROR_PATTERNS = {
+    '404': ['404', 'page not found', 'not found', '404 error'],
+    '403': ['403', 'forbidden', 'access denied', '403 error'],
+    '500': ['500', 'internal server error', 'server error', '500 error'],
+    '502': ['502', 'bad gateway', '502 error'],
+    '503': ['503', 'service unavailable', '503 error'],
+    '504': ['504', 'gateway timeout', '504 error']
+}
+
+# Chrome net error codes and their report messages
+ERROR_MAPPINGS = {
+    'ERR_NAME_NOT_RESOLVED': 'DNS resolution failed - Unable to resolve domain name',
+    'ERR_CONNECTION_REFUSED': 'Connection refused by the server',
+    'ERR_CONNECTION_TIMED_OUT': 'Connection timed out',
+    'ERR_NETWORK_UNREACHABLE': 'Network is unreachable',
+    'ERR_CONNECTION_RESET': 'Connection was reset',
+    'ERR_SSL_PROTOCOL_ERROR': 'SSL/TLS protocol error',
+    'ERR_CERT_AUTHORITY_INVALID': 'Invalid SSL certificate',
+    'ERR_BAD_SSL_CLIENT_AUTH_CERT': 'Invalid client SSL certificate',
+    'ERR_TUNNEL_CONNECTION_FAILED': 'Failed to establish tunnel connection',
+    'ERR_NO_SUPPORTED_PROXIES': 'No supported proxies',
+    'ERR_EMPTY_RESPONSE': 'Server returned empty response',
+    'ERR_RESPONSE_HEADERS_TRUNCATED': 'Response headers truncated',
+    'ERR_CONTENT_DECODING_FAILED': 'Content decoding failed'
+}
+
+# Matchers built from the tables above. Content errors get one regex per code, tried in
+# ERROR_PATTERNS order: a single alternation would miss a higher-ranked code overlapping
+# a match for another one ("1504043" holds both 504 and 404).
+CONTENT_ERROR_REGEXES = [
+    (code, re.compile("|".join(re.escape(pattern) for pattern in patterns), re.IGNORECASE))
+    for code, patterns in ERROR_PATTERNS.items()
+]
+NET_ERROR_REGEX = re.compile("|".join(ERROR_MAPPINGS), re.IGNORECASE)
+
+
+def iter_exception_chain(exc):
+    """Yield an exception and everything it wraps (cause, context, urllib3 reason)"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or getattr(exc, 'reason', None) or exc.__context__
+        if not isinstance(exc, BaseException):
+            exc = None
+
+
+def classify_network_error(exc):
+    """Map a low-level network exception to a Chrome net error code, if known"""
+    for error in iter_exception_chain(exc):
+        if isinstance(error, socket.gaierror) or 'NameResolutionError' in type(error).__name__:
+            return 'ERR_NAME_NOT_RESOLVED'
+        if isinstance(error, ConnectionRefusedError):
+            return 'ERR_CONNECTION_REFUSED'
+        if isinstance(error, ConnectionResetError):
+            return 'ERR_CONNECTION_RESET'
+        if isinstance(error, OSError) and error.errno == errno.ENETUNREACH:
+            return 'ERR_NETWORK_UNREACHABLE'
+    return None
+
+
+def format_http_error(status_code):
+    """Format an HTTP error status the same way check_page_errors reports it"""
+    return f"HTTP {status_code} Error"
+
+
+def match_net_error(text):
+    """Return the report message for the first Chrome net error code in text"""
+    match = NET_ERROR_REGEX.search(text or "")
+    return ERROR_MAPPINGS[match.group(0).upper()] if match else None
+
+
+def match_content_error(*texts):
+    """Return the status code whose error patterns appear in any of the texts.
+
+    Codes are ranked in ERROR_PATTERNS order, so a page mentioning both
+    "not found" and "forbidden" is reported as 404.
+    """
+    texts = [text for text in texts if text]
+    for code, regex in CONTENT_ERROR_REGEXES:
+        if any(regex.search(text) for text in texts):
+            return code
+    return None
@@ -1,11 +1,12 @@
 # utils/excel_handler.py
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 import allure
-import pandas as pd
 from datetime import datetime
 from time import time
 import os
 from .config_handler import Configuration
+from .navigation_timing import NavigationTiming, TIMING_FIELDS
 
 
 class ExcelHandler:
@@ -55,28 +56,12 @@ class ExcelHandler:
 
     @staticmethod
     def generate_report(results):
-        """Generate Excel report from test results"""
-        try:
-            # Prepare data for Excel
-            data = []
-            for index, result in enumerate(results, 1):
-                # Calculate load time for both successful and failed URLs
-                load_time = result.get('load_time', 0)
-                if load_time == 0 and result.get('start_time'):
-                    end_time = time() if 'end_time' not in result else result['end_time']
-                    load_time = (end_time - result['start_time']) * 1000
-
-                data.append({
-                    'S.no': index,
-                    'URL': result['url'],
-                    'Pass/Fail': 'Pass' if result['status'] == 'Success' else 'Fail',
-                    'Time(ms)': round(load_time, 2),
-                    #'Error': result.get('error', 'N/A') if result['status'] != 'Success' else 'N/A'
-                })
-
-            # Create DataFrame
-            df = pd.DataFrame(data)
+        """Generate Excel report from test results.
 
+        Rows are streamed into a write-only workbook, so ``results`` can be
+        any iterable (a ResultSink, for instance) and is only read once.
+        """
+        try:
             # Generate timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -90,32 +75,50 @@ class ExcelHandler:
             # Save Excel file
             output_path = os.path.join(output_dir, f"TestResults_{timestamp}.xlsx")
 
-            # Create workbook and select active sheet
-            wb = openpyxl.Workbook()
-            ws = wb.active
+            # Create a write-only workbook; rows go to disk as they are appended
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet()
 
-            # Write headers
             #headers = ['S.no', 'URL', 'Pass/Fail', 'Time(ms)', 'Error']
-            headers = ['S.no', 'URL', 'Pass/Fail', 'Time(ms)']
-            for col, header in enumerate(headers, 1):
-                ws.cell(row=1, column=col, value=header)
+            headers = ['S.no', 'URL', 'Pass/Fail', 'Time(ms)'] + [label for _, label in TIMING_FIELDS] + ['Cached']
 
-            # Write data
-            for row_idx, row_data in enumerate(data, 2):
-                for col_idx, (_, value) in enumerate(row_data.items(), 1):
-                    ws.cell(row=row_idx, column=col_idx, value=value)
-
-            # Apply basic styling
-            for cell in ws['1:1']:
-                cell.style = 'Headline 1'
-
-            # Adjust column widths
+            # Adjust column widths (must be set before any row is written)
             ws.column_dimensions['A'].width = 10
             ws.column_dimensions['B'].width = 50
             ws.column_dimensions['C'].width = 15
             ws.column_dimensions['D'].width = 15
+            for col in range(5, len(headers) + 1):
+                ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
             # ws.column_dimensions['E'].width = 50
 
+            # Write headers with basic styling
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.style = 'Headline 1'
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+            # Write data
+            for index, result in enumerate(results, 1):
+                # Calculate load time for both successful and failed URLs
+                load_time = result.get('load_time', 0)
+                if load_time == 0 and result.get('start_time'):
+                    end_time = time() if 'end_time' not in result else result['end_time']
+                    load_time = (end_time - result['start_time']) * 1000
+
+                row = [
+                    index,
+                    result['url'],
+                    'Pass' if result['status'] == 'Success' else 'Fail',
+                    round(load_time, 2),
+                    #result.get('error', 'N/A') if result['status'] != 'Success' else 'N/A'
+                ]
+                # Navigation timing breakdown; empty cells when the page was never rendered
+                row.extend(NavigationTiming.format_field(result.get('timing'), key) for key, _ in TIMING_FIELDS)
+                row.append('Yes' if result.get('cached') else 'No')
+                ws.append(row)
+
             # Save the workbook
             wb.save(output_path)
 
@@ -0,0 +1,201 @@
+# utils/history_store.py
+import os
+import sqlite3
+import threading
+from time import time
+from urllib.parse import urlparse
+from .config_handler import Configuration
+from .url_handler import URLHandler
+
+# Lets spawned shard processes write their results under the parent's run
+RUN_ID_ENV = "URL_PROCESSOR_RUN_ID"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    run_profile TEXT,
+    total INTEGER,
+    passed INTEGER,
+    failed INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    row_number INTEGER,
+    url TEXT NOT NULL,
+    host TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    load_time REAL,
+    attempts INTEGER,
+    cached INTEGER NOT NULL DEFAULT 0,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    seq INTEGER NOT NULL,
+    status TEXT,
+    timestamp REAL,
+    message TEXT
+);
+CREATE TABLE IF NOT EXISTS timings (
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    name TEXT NOT NULL,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_results_host_checked ON results(host, checked_at);
+CREATE INDEX IF NOT EXISTS idx_results_status_checked ON results(status, checked_at);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_steps_result ON steps(result_id);
+CREATE INDEX IF NOT EXISTS idx_timings_result ON timings(result_id);
+"""
+
+
+class HistoryStore:
+    """SQLite history of runs, results, steps and timings.
+
+    Results are buffered and written ``batch_size`` at a time in one
+    transaction. Shard processes open their own connection to the same
+    database; WAL mode lets them write while reports are being queried.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path, batch_size=50):
+        self.path = path
+        self.batch_size = max(1, int(batch_size))
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self._pending = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Get this process's store configured from config.json"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                config = Configuration.get_config()
+                cls._shared = cls(config["history_db"], batch_size=config["history_batch_size"])
+            return cls._shared
+
+    @classmethod
+    def flush_shared(cls):
+        with cls._shared_lock:
+            store = cls._shared
+        if store:
+            store.flush()
+
+    @classmethod
+    def close_shared(cls):
+        with cls._shared_lock:
+            store, cls._shared = cls._shared, None
+        if store:
+            store.close()
+
+    @staticmethod
+    def host_of(url):
+        host = URLHandler.extract_host_from_url(url)
+        return (urlparse(f"//{host}").hostname or host).lower()
+
+    def start_run(self, run_profile=None, export=True):
+        """Create a run; with ``export`` its id is passed on to shard processes started after this"""
+        with self._lock:
+            with self._connection:
+                cursor = self._connection.execute(
+                    "INSERT INTO runs (started_at, run_profile) VALUES (?, ?)", (time(), run_profile))
+        run_id = cursor.lastrowid
+        if export:
+            os.environ[RUN_ID_ENV] = str(run_id)
+        return run_id
+
+    @staticmethod
+    def current_run_id():
+        """Run exported by this or the parent process, or None"""
+        run_id = os.environ.get(RUN_ID_ENV)
+        return int(run_id) if run_id else None
+
+    def finish_run(self, run_id, total=None, passed=None):
+        """Close a run with the caller's counts or, without them, the results stored for it"""
+        self.flush()
+        with self._lock:
+            if total is None:
+                total, passed = self._connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(status = 'Success'), 0) FROM results WHERE run_id = ?",
+                    (run_id,)).fetchone()
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE runs SET finished_at = ?, total = ?, passed = ?, failed = ? WHERE id = ?",
+                    (time(), total, passed, total - passed, run_id))
+        if os.environ.get(RUN_ID_ENV) == str(run_id):
+            os.environ.pop(RUN_ID_ENV)
+
+    def add(self, row_number, url, result, run_id):
+        """Buffer a result; a full batch is written in one transaction"""
+        with self._lock:
+            self._pending.append((run_id, row_number, url, result))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+            self._write(batch)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        try:
+            with self._connection:
+                for run_id, row_number, url, result in batch:
+                    cursor = self._connection.execute(
+                        "INSERT INTO results (run_id, row_number, url, host, status, error, load_time, "
+                        "attempts, cached, checked_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (run_id, row_number, url, self.host_of(url), result.get('status', 'Failed'),
+                         result.get('error'), result.get('load_time'), result.get('attempts'),
+                         1 if result.get('cached') else 0, result.get('end_time') or time()))
+                    result_id = cursor.lastrowid
+                    self._connection.executemany(
+                        "INSERT INTO steps (result_id, seq, status, timestamp, message) VALUES (?, ?, ?, ?, ?)",
+                        [(result_id, seq, step.get('status'), step.get('timestamp'), step.get('message'))
+                         for seq, step in enumerate(result.get('steps') or [], 1)])
+                    timings = dict(result.get('timing') or {})
+                    timings.update({f"stage:{name}": value
+                                    for name, value in (result.get('stage_timings') or {}).items()})
+                    self._connection.executemany(
+                        "INSERT INTO timings (result_id, name, value) VALUES (?, ?, ?)",
+                        [(result_id, name, value) for name, value in timings.items()])
+        except Exception as e:
+            print(f"Error writing run history: {str(e)}")
+
+    def recorded_rows(self, run_id):
+        """Row numbers with a result stored for a run, from any process"""
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT DISTINCT row_number FROM results WHERE run_id = ?", (run_id,)).fetchall()
+        return {row_number for row_number, in rows}
+
+    def failures_for_host(self, host, days=30):
+        """Failed results for a host within the last ``days`` days, newest first"""
+        self.flush()
+        since = time() - days * 86400
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT run_id, row_number, url, status, error, load_time, checked_at FROM results "
+                "WHERE host = ? AND status != 'Success' AND checked_at >= ? ORDER BY checked_at DESC",
+                (host.lower(), since)).fetchall()
+        columns = ('run_id', 'row_number', 'url', 'status', 'error', 'load_time', 'checked_at')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,105 @@
+# utils/host_scheduler.py
+import heapq
+import threading
+from collections import deque
+from itertools import count
+from time import monotonic
+
+
+class HostScheduler:
+    """Work queue that keeps checks polite per host.
+
+    Each host gets at most ``max_in_flight`` concurrent checks, started at
+    least ``min_interval`` seconds apart. Work for other hosts is handed out
+    immediately, so a diverse URL list never waits on a single site.
+    """
+
+    def __init__(self, min_interval=2, max_in_flight=1):
+        self.min_interval = max(0, min_interval)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._pending = {}
+        self._in_flight = {}
+        self._next_start = {}
+        # (next start, host) for hosts gone idle; their pacing is forgotten once it has passed
+        self._idle = []
+        self._ready = []
+        self._scheduled = set()
+        self._outstanding = 0
+        self._sequence = count()
+        self._condition = threading.Condition()
+
+    def _schedule(self, host):
+        """Put a host on the ready heap if it has work and a free slot"""
+        if host in self._scheduled or not self._pending.get(host):
+            return
+        if self._in_flight.get(host, 0) >= self.max_in_flight:
+            return
+        seq, not_before, _ = self._pending[host][0]
+        eligible_at = max(self._next_start.get(host, 0), not_before)
+        heapq.heappush(self._ready, (eligible_at, seq, host))
+        self._scheduled.add(host)
+
+    def _forget_idle_hosts(self):
+        """Drop pacing for idle hosts whose interval has passed"""
+        now = monotonic()
+        while self._idle and self._idle[0][0] <= now:
+            _, host = heapq.heappop(self._idle)
+            # Skip entries superseded by a later visit to the host
+            if (host not in self._in_flight and not self._pending.get(host)
+                    and self._next_start.get(host, 0) <= now):
+                self._next_start.pop(host, None)
+                self._pending.pop(host, None)
+
+    def add(self, item, host, not_before=0):
+        """Queue an item for a host; ``not_before`` is a monotonic time"""
+        with self._condition:
+            self._pending.setdefault(host, deque()).append((next(self._sequence), not_before, item))
+            self._outstanding += 1
+            self._schedule(host)
+            self._condition.notify_all()
+
+    def get(self):
+        """Block until some host may start its next item.
+
+        Returns ``(host, item)``, or ``None`` once every added item is done.
+        """
+        with self._condition:
+            while True:
+                if self._outstanding == 0:
+                    return None
+
+                if self._ready:
+                    eligible_at, _, host = self._ready[0]
+                    wait_time = eligible_at - monotonic()
+                    if wait_time <= 0:
+                        heapq.heappop(self._ready)
+                        self._scheduled.discard(host)
+                        _, _, item = self._pending[host].popleft()
+                        self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                        self._next_start[host] = monotonic() + self.min_interval
+                        self._schedule(host)
+                        return host, item
+                    self._condition.wait(wait_time)
+                else:
+                    self._condition.wait()
+
+    def done(self, host, paced=True):
+        """Mark an item returned by ``get`` as finished.
+
+        ``paced=False`` means the item never contacted the host, so the
+        host's next item may start without waiting for ``min_interval``.
+        """
+        with self._condition:
+            if not paced:
+                self._next_start[host] = monotonic()
+            self._in_flight[host] -= 1
+            self._outstanding -= 1
+            if not self._in_flight[host] and not self._pending.get(host):
+                # Forget idle hosts so memory stays bounded on large, diverse lists; the next
+                # start time is kept until it has passed, in case the host gets more work
+                self._in_flight.pop(host, None)
+                self._pending.pop(host, None)
+                heapq.heappush(self._idle, (self._next_start.get(host, 0), host))
+            self._forget_idle_hosts()
+            self._schedule(host)
+            self._condition.notify_all()
@@ -0,0 +1,157 @@
+# utils/http_probe.py
+import hashlib
+import threading
+from time import time
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from .config_handler import Configuration
+from .error_patterns import ERROR_MAPPINGS, classify_network_error, format_http_error
+from .url_handler import URLHandler
+
+# Chrome runs with --ignore-certificate-errors, so the probe does not verify either
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Failures that are final without a browser; anything else escalates to Selenium
+HARD_FAILURE_CODES = ('ERR_NAME_NOT_RESOLVED', 'ERR_CONNECTION_REFUSED')
+
+
+class HTTPProbe:
+    _session = None
+    _session_lock = threading.Lock()
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    @classmethod
+    def get_session(cls):
+        """Get the shared HTTP session with a connection pool sized for all workers"""
+        with cls._session_lock:
+            if cls._session is None:
+                config = Configuration.get_config()
+                pool_size = max(10, config["max_workers"])
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = cls.USER_AGENT
+                session.verify = False
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def close_session(cls):
+        """Close pooled HTTP connections"""
+        with cls._session_lock:
+            session, cls._session = cls._session, None
+        if session:
+            session.close()
+
+    @classmethod
+    def probe(cls, url, timeout=None):
+        """Resolve, connect and fetch response headers for a URL without a browser"""
+        timeout = timeout or Configuration.get_config()["preflight_timeout"]
+        formatted_url = URLHandler.format_url(url)
+        probe = {
+            'url': formatted_url,
+            'final_url': None,
+            'status_code': None,
+            'redirects': 0,
+            'ttfb': None,
+            'duration': 0,
+            'content_type': None,
+            'etag': None,
+            'last_modified': None,
+            'error': None,
+            'hard_failure': False
+        }
+
+        start_time = time()
+        try:
+            # stream=True stops after the headers; the body is never downloaded
+            with cls.get_session().get(formatted_url, timeout=timeout, allow_redirects=True,
+                                       stream=True) as response:
+                probe['final_url'] = response.url
+                probe['status_code'] = response.status_code
+                probe['redirects'] = len(response.history)
+                probe['ttfb'] = response.elapsed.total_seconds() * 1000
+                probe['content_type'] = response.headers.get('Content-Type', '')
+                probe['etag'] = response.headers.get('ETag')
+                probe['last_modified'] = response.headers.get('Last-Modified')
+
+                if response.status_code >= 400:
+                    probe['error'] = format_http_error(response.status_code)
+                    probe['hard_failure'] = True
+
+        except requests.RequestException as e:
+            error_code = classify_network_error(e)
+            if error_code in HARD_FAILURE_CODES:
+                probe['error'] = ERROR_MAPPINGS[error_code]
+                probe['hard_failure'] = True
+            else:
+                # Timeouts, TLS quirks and the like are left for Chrome to judge
+                probe['error'] = f"Pre-flight request failed: {str(e)}"
+
+        finally:
+            probe['duration'] = (time() - start_time) * 1000
+
+        return probe
+
+    @classmethod
+    def revalidate(cls, url, etag=None, last_modified=None, content_hash=None, timeout=None,
+                   max_body=5 * 1024 * 1024):
+        """Check with a conditional request whether a previously checked page changed.
+
+        A 304, an unchanged ETag or an identical body hash means unchanged.
+        The body is only downloaded (up to ``max_body`` bytes) when the server
+        did not answer the conditional request, to compute ``content_hash``.
+        """
+        timeout = timeout or Configuration.get_config()["preflight_timeout"]
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        check = {'changed': True, 'status_code': None, 'etag': etag, 'last_modified': last_modified,
+                 'content_hash': content_hash, 'error': None}
+
+        try:
+            with cls.get_session().get(URLHandler.format_url(url), headers=headers, timeout=timeout,
+                                       allow_redirects=True, stream=True) as response:
+                check['status_code'] = response.status_code
+                if response.status_code == 304:
+                    check['changed'] = False
+                    return check
+                if response.status_code >= 400:
+                    check['error'] = format_http_error(response.status_code)
+                    return check
+
+                check['etag'] = response.headers.get('ETag')
+                check['last_modified'] = response.headers.get('Last-Modified')
+                if etag and check['etag'] == etag and not etag.startswith('W/'):
+                    check['changed'] = False
+                    return check
+
+                digest = hashlib.sha256()
+                size = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    size += len(chunk)
+                    if size > max_body:
+                        check['content_hash'] = None
+                        return check
+                    digest.update(chunk)
+                check['content_hash'] = digest.hexdigest()
+                check['changed'] = check['content_hash'] != content_hash
+        except requests.RequestException as e:
+            check['error'] = f"Revalidation request failed: {str(e)}"
+        return check
+
+    @staticmethod
+    def needs_browser(probe, capture_screenshots=True):
+        """Check whether a URL that passed pre-flight still has to be rendered"""
+        if capture_screenshots or probe['error']:
+            return True
+        # HTML pages are rendered so soft errors in the content can be detected
+        return 'html' in (probe['content_type'] or '').lower()
@@ -0,0 +1,102 @@
+# utils/image_handler.py
+import io
+import os
+from .config_handler import Configuration
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; screenshots are then stored as captured PNGs
+    Image = None
+
+# format name -> (Pillow format, file extension, MIME type)
+IMAGE_FORMATS = {
+    'png': ('PNG', 'png', 'image/png'),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+    'webp': ('WEBP', 'webp', 'image/webp')
+}
+
+
+class ScreenshotProcessor:
+    """Turns a captured PNG into an optional full-size image plus a small thumbnail"""
+
+    def __init__(self, image_format='png', quality=80, max_width=None, keep_full_size=True,
+                 thumbnail_max_width=480, thumbnail_format='jpeg', thumbnail_quality=60):
+        self.image_format = self._check_format(image_format)
+        self.quality = quality
+        self.max_width = max_width
+        self.keep_full_size = keep_full_size
+        self.thumbnail_max_width = thumbnail_max_width
+        self.thumbnail_format = self._check_format(thumbnail_format)
+        self.thumbnail_quality = thumbnail_quality
+
+    @staticmethod
+    def _check_format(image_format):
+        image_format = (image_format or 'png').lower()
+        if image_format == 'jpg':
+            image_format = 'jpeg'
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unsupported screenshot format: {image_format}")
+        return image_format
+
+    @classmethod
+    def from_config(cls):
+        """Create a processor from config.json settings"""
+        config = Configuration.get_config()
+        return cls(
+            image_format=config["screenshot_format"],
+            quality=config["screenshot_quality"],
+            max_width=config["screenshot_max_width"],
+            keep_full_size=config["keep_full_screenshot"],
+            thumbnail_max_width=config["thumbnail_max_width"],
+            thumbnail_format=config["thumbnail_format"],
+            thumbnail_quality=config["thumbnail_quality"]
+        )
+
+    @staticmethod
+    def mime_type(image_format):
+        return IMAGE_FORMATS[image_format][2]
+
+    @staticmethod
+    def encode(image, image_format, quality, max_width=None):
+        """Resize an image to max_width (keeping aspect ratio) and encode it"""
+        if max_width and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height), Image.LANCZOS)
+        if image_format == 'jpeg' and image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        buffer = io.BytesIO()
+        options = {'optimize': True} if image_format == 'png' else {'quality': quality}
+        image.save(buffer, format=IMAGE_FORMATS[image_format][0], **options)
+        return buffer.getvalue()
+
+    def process(self, png, filepath):
+        """Return a list of (kind, path, data, image_format) outputs for one screenshot.
+
+        ``kind`` is ``'screenshot'`` for the full-size image and ``'thumbnail'``
+        for the report thumbnail.
+        """
+        base_path = os.path.splitext(filepath)[0]
+
+        if Image is None:
+            return [('screenshot', f"{base_path}.png", png, 'png')]
+
+        outputs = []
+        with Image.open(io.BytesIO(png)) as image:
+            image.load()
+
+            if self.keep_full_size:
+                if self.image_format == 'png' and not self.max_width:
+                    data = png
+                else:
+                    data = self.encode(image, self.image_format, self.quality, self.max_width)
+                extension = IMAGE_FORMATS[self.image_format][1]
+                outputs.append(('screenshot', f"{base_path}.{extension}", data, self.image_format))
+
+            if self.thumbnail_max_width:
+                data = self.encode(image, self.thumbnail_format, self.thumbnail_quality,
+                                   self.thumbnail_max_width)
+                extension = IMAGE_FORMATS[self.thumbnail_format][1]
+                outputs.append(('thumbnail', f"{base_path}_thumb.{extension}", data, self.thumbnail_format))
+
+        return outputs or [('screenshot', f"{base_path}.png", png, 'png')]
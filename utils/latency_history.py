@@ -0,0 +1,155 @@
+# utils/latency_history.py
+import json
+import math
+import os
+import threading
+from contextlib import contextmanager
+from .config_handler import Configuration
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; saves from concurrent shards may then lose samples
+    fcntl = None
+
+
+class LatencyHistory:
+    """Persistent per-host page load latencies used to size page load timeouts.
+
+    Samples (milliseconds) are kept per host, newest last, capped at
+    ``max_samples``. Hosts with at least ``min_samples`` get a timeout of
+    p99 x ``safety_factor``, clamped to ``[min_timeout, max_timeout]``
+    seconds; other hosts get ``default_timeout``. Loads cut off by the
+    timeout are recorded as censored samples at the time they were stopped.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, default_timeout=60, min_timeout=10, max_timeout=60,
+                 safety_factor=3, min_samples=5, max_samples=100):
+        self.path = path
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.safety_factor = safety_factor
+        self.min_samples = max(1, int(min_samples))
+        self.max_samples = max(1, int(max_samples))
+        self._samples = {}
+        self._new_samples = {}
+        self._lock = threading.Lock()
+        if path:
+            self._samples = self.load(path)
+
+    @classmethod
+    def get_shared(cls):
+        """Get the process-wide history configured from config.json"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                config = Configuration.get_config()
+                cls._shared = cls(
+                    path=config["latency_history_file"],
+                    default_timeout=config["page_load_timeout"],
+                    min_timeout=config["adaptive_timeout_min"],
+                    max_timeout=config["adaptive_timeout_max"],
+                    safety_factor=config["adaptive_timeout_factor"],
+                    min_samples=config["latency_min_samples"],
+                    max_samples=config["latency_max_samples"]
+                )
+            return cls._shared
+
+    @classmethod
+    def save_shared(cls):
+        """Persist samples recorded by the shared history, if it was used"""
+        with cls._shared_lock:
+            history = cls._shared
+        if history:
+            history.save()
+
+    @staticmethod
+    def load(path):
+        """Read host -> samples from disk; a missing or corrupt file starts empty"""
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {host: list(samples) for host, samples in data.get("hosts", {}).items()}
+        except Exception as e:
+            print(f"Error reading latency history: {str(e)}")
+            return {}
+
+    def record(self, host, latency_ms):
+        with self._lock:
+            for store in (self._samples, self._new_samples):
+                samples = store.setdefault(host, [])
+                samples.append(round(latency_ms, 2))
+                del samples[:-self.max_samples]
+
+    def record_timeout(self, host, elapsed_seconds):
+        """Record a load cut off after ``elapsed_seconds`` as a sample of at least that long.
+
+        Without it a host that slowed past its timeout would never add a
+        sample, and its timeout could never grow.
+        """
+        self.record(host, elapsed_seconds * 1000)
+
+    def percentile(self, host, percent=99):
+        """Nearest-rank latency percentile for a host, or None without enough samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(host, []))
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(1, math.ceil(percent / 100 * len(samples)))
+        return samples[rank - 1]
+
+    def timeout_for(self, host):
+        """Page load timeout in seconds for a host"""
+        p99 = self.percentile(host, 99)
+        if p99 is None:
+            return self.default_timeout
+        timeout = p99 / 1000 * self.safety_factor
+        return max(self.min_timeout, min(self.max_timeout, math.ceil(timeout)))
+
+    @staticmethod
+    @contextmanager
+    def _file_lock(path):
+        """Hold an exclusive lock on a sidecar lock file across processes"""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def save(self):
+        """Merge this run's samples into the file on disk.
+
+        The read, merge and write happen under a file lock, so samples saved
+        at the same time by other shard processes are kept; the file is
+        replaced atomically.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            new_samples, self._new_samples = self._new_samples, {}
+        if not new_samples:
+            return
+
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
+            with self._file_lock(self.path):
+                merged = self.load(self.path)
+                for host, samples in new_samples.items():
+                    merged[host] = (merged.get(host, []) + samples)[-self.max_samples:]
+
+                temp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump({"hosts": merged}, f)
+                os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving latency history: {str(e)}")
@@ -0,0 +1,67 @@
+# utils/navigation_timing.py
+import allure
+
+# Navigation Timing Level 2 phases plus a Resource Timing summary, in one round-trip.
+# Durations are milliseconds; ttfb, dom_content_loaded and load are measured from navigation start.
+NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+const span = (start, end) => (start > 0 && end >= start) ? end - start : 0;
+const mark = (value) => value > 0 ? value : null;
+const resources = performance.getEntriesByType('resource');
+let resourceBytes = 0;
+for (const entry of resources) { resourceBytes += entry.transferSize || 0; }
+return {
+    redirect: span(nav.redirectStart, nav.redirectEnd),
+    dns: span(nav.domainLookupStart, nav.domainLookupEnd),
+    connect: span(nav.connectStart, nav.connectEnd),
+    tls: nav.secureConnectionStart > 0 ? span(nav.secureConnectionStart, nav.connectEnd) : 0,
+    ttfb: mark(nav.responseStart),
+    download: span(nav.responseStart, nav.responseEnd),
+    dom_content_loaded: mark(nav.domContentLoadedEventEnd),
+    load: mark(nav.loadEventEnd),
+    transfer_size: nav.transferSize || 0,
+    resource_count: resources.length,
+    resource_transfer_size: resourceBytes
+};
+"""
+
+# Result key -> report label, in report column order
+TIMING_FIELDS = [
+    ('dns', 'DNS(ms)'),
+    ('connect', 'Connect(ms)'),
+    ('tls', 'TLS(ms)'),
+    ('ttfb', 'TTFB(ms)'),
+    ('dom_content_loaded', 'DOMContentLoaded(ms)'),
+    ('load', 'Load(ms)'),
+    ('transfer_size', 'Transfer(KB)')
+]
+
+
+class NavigationTiming:
+    @staticmethod
+    def collect(driver):
+        """Read the page's navigation timing breakdown, or None if unavailable"""
+        try:
+            timing = driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+        except Exception as e:
+            print(f"Error collecting navigation timing: {str(e)}")
+            allure.attach(
+                body=f"Error collecting navigation timing: {str(e)}",
+                name="Navigation Timing Error",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            return None
+
+        if not timing:
+            return None
+        return {key: round(value, 2) if isinstance(value, float) else value for key, value in timing.items()}
+
+    @staticmethod
+    def format_field(timing, key):
+        """Report value for a timing field; sizes are shown in KB, missing phases as None"""
+        if not timing or timing.get(key) is None:
+            return None
+        if key == 'transfer_size':
+            return round(timing[key] / 1024, 2)
+        return round(timing[key], 2)
@@ -0,0 +1,80 @@
+# utils/page_readiness.py
+import allure
+
+# Resolves once document.readyState has reached one of readyStates and neither
+# the DOM nor the network has changed for quietMs, or reports why it gave up.
+READINESS_SCRIPT = """
+const loadTimeoutMs = arguments[0];
+const quietMs = arguments[1];
+const maxQuietWaitMs = arguments[2];
+const readyStates = arguments[3];
+const done = arguments[arguments.length - 1];
+
+const start = performance.now();
+let completeAt = null;
+let lastActivity = performance.now();
+const markActivity = () => { lastActivity = performance.now(); };
+
+const mutationObserver = new MutationObserver(markActivity);
+mutationObserver.observe(document, { childList: true, subtree: true, characterData: true });
+
+let resourceObserver = null;
+try {
+    resourceObserver = new PerformanceObserver(markActivity);
+    resourceObserver.observe({ type: 'resource' });
+} catch (e) {}
+
+const finish = (complete, quiet) => {
+    mutationObserver.disconnect();
+    if (resourceObserver) { resourceObserver.disconnect(); }
+    done({ complete: complete, quiet: quiet, waited: performance.now() - start });
+};
+
+const tick = () => {
+    const now = performance.now();
+    if (completeAt === null) {
+        if (readyStates.indexOf(document.readyState) !== -1) {
+            completeAt = now;
+        } else if (now - start >= loadTimeoutMs) {
+            return finish(false, false);
+        }
+    }
+    if (completeAt !== null) {
+        if (now - lastActivity >= quietMs) {
+            return finish(true, true);
+        }
+        if (now - completeAt >= maxQuietWaitMs) {
+            return finish(true, false);
+        }
+    }
+    setTimeout(tick, 50);
+};
+tick();
+"""
+
+
+class PageReadiness:
+    @staticmethod
+    def wait_until_stable(driver, timeout=30, quiet_ms=500, max_quiet_wait=10, require_complete=True):
+        """Wait for the page to finish loading and go quiet.
+
+        With ``require_complete=False`` (eager/none page load strategies) an
+        ``interactive`` document is enough, so the quiet window starts as soon
+        as the DOM is parsed instead of after every subresource has loaded.
+
+        Returns a dict with ``complete`` (readyState reached the required state),
+        ``quiet`` (DOM and network were idle for ``quiet_ms``) and ``waited``
+        (milliseconds spent in the browser).
+        """
+        driver.set_script_timeout(timeout + max_quiet_wait + 5)
+        ready_states = ['complete'] if require_complete else ['interactive', 'complete']
+        state = driver.execute_async_script(
+            READINESS_SCRIPT, timeout * 1000, quiet_ms, max_quiet_wait * 1000, ready_states
+        )
+        if not state['quiet'] and state['complete']:
+            allure.attach(
+                body=f"Page kept changing for {max_quiet_wait}s after load; continuing",
+                name="Page Readiness",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        return state
@@ -0,0 +1,164 @@
+# utils/profiler.py
+import json
+import math
+import os
+import random
+from datetime import datetime
+from time import perf_counter
+from .config_handler import Configuration
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.profiler._stack.append(self.name)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (perf_counter() - self.start) * 1000
+        path = "/".join(self.profiler._stack)
+        self.profiler._stack.pop()
+        self.profiler.timings[path] = self.profiler.timings.get(path, 0) + elapsed
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class StageAggregator:
+    """Run-level stage statistics, accumulated one result at a time.
+
+    Each stage keeps its count, sum and max plus a uniform reservoir sample
+    of at most ``reservoir_size`` timings for the p95, so memory stays
+    bounded however many URLs are processed. The p95 is exact while a stage
+    has no more samples than the reservoir holds.
+    """
+
+    RESERVOIR_SIZE = 1000
+
+    def __init__(self, reservoir_size=RESERVOIR_SIZE, seed=0):
+        self.reservoir_size = max(1, int(reservoir_size))
+        self.urls = 0
+        self._stages = {}
+        self._random = random.Random(seed)
+
+    def add(self, result):
+        self.urls += 1
+        for name, elapsed in (result.get('stage_timings') or {}).items():
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {'count': 0, 'sum': 0, 'max': elapsed, 'reservoir': []}
+            stage['count'] += 1
+            stage['sum'] += elapsed
+            stage['max'] = max(stage['max'], elapsed)
+            reservoir = stage['reservoir']
+            if len(reservoir) < self.reservoir_size:
+                reservoir.append(elapsed)
+            else:
+                slot = self._random.randrange(stage['count'])
+                if slot < self.reservoir_size:
+                    reservoir[slot] = elapsed
+
+    def stages(self):
+        """Count, sum, mean, max and p95 per stage"""
+        return {
+            name: {
+                'count': stage['count'],
+                'sum': round(stage['sum'], 2),
+                'mean': round(stage['sum'] / stage['count'], 2),
+                'max': round(stage['max'], 2),
+                'p95': round(Profiler.percentile(stage['reservoir'], 95), 2)
+            }
+            for name, stage in sorted(self._stages.items())
+        }
+
+
+class Profiler:
+    """Per-URL stage timer.
+
+    ``with profiler.span("stage"):`` records elapsed milliseconds on a
+    monotonic clock. Nested spans are keyed by their path ("page_load/navigate")
+    and repeated spans accumulate. A disabled profiler hands out a shared
+    no-op span, so instrumentation can stay in place at negligible cost.
+    A profiler is not thread-safe; use one per URL.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.timings = {}
+        self._stack = []
+
+    @classmethod
+    def from_config(cls):
+        return cls(Configuration.get_config()["profiling_enabled"])
+
+    def span(self, name):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name)
+
+    def results(self):
+        """Stage timings in milliseconds, rounded for reporting"""
+        return {name: round(elapsed, 2) for name, elapsed in self.timings.items()}
+
+    @staticmethod
+    def percentile(values, percent):
+        """Nearest-rank percentile of a non-empty list"""
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @staticmethod
+    def aggregator(results):
+        """StageAggregator fed with every result"""
+        aggregator = StageAggregator()
+        for result in results:
+            aggregator.add(result)
+        return aggregator
+
+    @staticmethod
+    def aggregate(results):
+        """Run-level count, sum, mean, max and p95 per stage from results' stage_timings"""
+        return Profiler.aggregator(results).stages()
+
+    @staticmethod
+    def write_summary(results, output_dir=None):
+        """Write run-level stage aggregates as JSON next to the reports.
+
+        ``results`` may be a StageAggregator already fed while the results
+        were read for other reports. Returns the file path, or None when no
+        result carries stage timings.
+        """
+        aggregator = results if isinstance(results, StageAggregator) else Profiler.aggregator(results)
+        stages = aggregator.stages()
+        if not stages:
+            return None
+
+        output_dir = output_dir or Configuration.get_path("extent_report")
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(output_dir, f"StageProfile_{timestamp}.json")
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump({'generated': timestamp, 'urls': aggregator.urls, 'stages': stages}, f, indent=2)
+
+        print(f"Stage profile written: {output_path}")
+        return output_path
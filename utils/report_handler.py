@@ -1,35 +1,101 @@
 import os
 import base64
+import shutil
+import tempfile
 import time
 import json
 from datetime import datetime
 from .config_handler import Configuration
+from .image_handler import ScreenshotProcessor
+from .navigation_timing import NavigationTiming, TIMING_FIELDS
+from .result_record import ResultRecord, format_clock
 
 
 class ReportHandler:
     @staticmethod
     def encode_image_to_base64(image_path):
         try:
+            extension = os.path.splitext(image_path)[1].lstrip('.').lower()
+            mime_type = "image/jpeg" if extension in ("jpg", "jpeg") else f"image/{extension or 'png'}"
             with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode()
-                return f"data:image/png;base64,{encoded_string}"
+                return ReportHandler.encode_bytes_to_base64(image_file.read(), mime_type)
         except Exception as e:
             print(f"Error encoding image: {str(e)}")
             return None
 
+    @staticmethod
+    def encode_bytes_to_base64(image_data, mime_type="image/png"):
+        """Encode an in-memory image as a data URI"""
+        encoded_string = base64.b64encode(image_data).decode()
+        return f"data:{mime_type};base64,{encoded_string}"
+
+    @staticmethod
+    def has_screenshot(result):
+        return bool(result.get('thumbnail_data') or result.get('screenshot_data') or (
+            result.get('screenshot') and os.path.exists(result['screenshot'])))
+
+    @staticmethod
+    def get_screenshot_data_uri(result):
+        """Data URI for a result's screenshot, using the thumbnail unless configured otherwise"""
+        use_thumbnail = Configuration.get_config()["report_screenshot"] == "thumbnail"
+        if use_thumbnail and result.get('thumbnail_data'):
+            return ReportHandler.encode_bytes_to_base64(
+                result['thumbnail_data'], ScreenshotProcessor.mime_type(result['thumbnail_format']))
+        if result.get('screenshot_data'):
+            return ReportHandler.encode_bytes_to_base64(result['screenshot_data'])
+        if use_thumbnail and result.get('thumbnail') and os.path.exists(result['thumbnail']):
+            return ReportHandler.encode_image_to_base64(result['thumbnail'])
+        return ReportHandler.encode_image_to_base64(result['screenshot'])
+
+    @staticmethod
+    def get_full_size_link(result):
+        """Link to the full-size screenshot file when the report embeds a thumbnail"""
+        screenshot = result.get('screenshot')
+        if not result.get('thumbnail') or screenshot == result['thumbnail'] or not screenshot:
+            return ""
+        if not os.path.exists(screenshot):
+            return ""
+        relative_path = os.path.relpath(screenshot, Configuration.get_path("extent_report"))
+        return f"""<div style="margin-top: 10px;">
+                                                <a href="{relative_path.replace(os.sep, '/')}" target="_blank">
+                                                    <i class="fas fa-expand"></i> Open full-size screenshot
+                                                </a>
+                                            </div>"""
+
+    @staticmethod
+    def serializable_result(result):
+        """Copy of a result without in-memory binary fields, for the test data viewer"""
+        return ResultRecord.as_dict(result)
+
     @staticmethod
     def calculate_stats(results):
-        total = len(results)
-        passed = sum(1 for r in results if r['status'] == 'Success')
+        # One pass, so results can be streamed from disk
+        total = passed = circuit_open = 0
+        total_duration = 0
+        run_profiles = set()
+        circuit_hosts = set()
+        for r in results:
+            total += 1
+            if r['status'] == 'Success':
+                passed += 1
+            total_duration += r.get('load_time', 0)
+            if r.get('run_profile'):
+                run_profiles.add(r['run_profile'])
+            if r.get('circuit_open'):
+                circuit_open += 1
+                if r.get('host'):
+                    circuit_hosts.add(r['host'])
         failed = total - passed
         pass_rate = (passed / total * 100) if total > 0 else 0
-        total_duration = sum(result.get('load_time', 0) for result in results)
         return {
             'total': total,
             'passed': passed,
             'failed': failed,
             'pass_rate': pass_rate,
-            'total_duration': total_duration
+            'total_duration': total_duration,
+            'run_profile': ", ".join(sorted(run_profiles)) or "N/A",
+            'circuit_open': circuit_open,
+            'circuit_hosts': sorted(circuit_hosts)
         }
 
     @staticmethod
@@ -130,6 +196,22 @@ class ReportHandler:
                 color: #FFFFFF;
             }
 
+            .stat-item.profile {
+                background: rgba(255, 255, 255, 0.2);
+            }
+            .stat-item.profile .stat-value {
+                color: #FFFFFF;
+                font-size: 1.1rem;
+            }
+
+            .stat-item.circuit {
+                background: rgba(255, 255, 255, 0.2);
+            }
+            .stat-item.circuit .stat-value {
+                color: #FFFFFF;
+                font-size: 1.1rem;
+            }
+
             /* Left Panel */
             .left-panel {
                 width: 400px;
@@ -380,6 +462,12 @@ class ReportHandler:
                 }
 
                 if (container.style.display === 'none' || container.style.display === '') {
+                    // Screenshots are shared between results and only decoded when first shown
+                    if (typeof screenshotData !== 'undefined') {
+                        container.querySelectorAll('img[data-screenshot-ref]:not([src])').forEach(img => {
+                            img.src = screenshotData[img.dataset.screenshotRef];
+                        });
+                    }
                     container.style.display = 'block';
                     btn.innerHTML = '<i class="fas fa-times"></i> Hide Screenshot';
                     btn.classList.add('active');
@@ -461,8 +549,13 @@ class ReportHandler:
         """
 
     @staticmethod
-    def generate_content_section(result, index):
-        """Generate HTML content for a single test result."""
+    def generate_content_section(result, index, screenshot_refs=None):
+        """Generate HTML content for a single test result.
+
+        When ``screenshot_refs`` is given, each distinct image is embedded once
+        as a ``screenshotData`` entry and later duplicates only reference it;
+        ``screenshot_refs`` maps screenshot keys to those reference ids.
+        """
         try:
             # Calculate load time for both successful and failed URLs
             load_time = result.get('load_time', 0)
@@ -489,6 +582,7 @@ class ReportHandler:
                                                       style="display: inline-block; padding: 4px 12px; border-radius: 4px; font-size: 13px; font-weight: 600;">
                                                     {result['status']}
                                                 </span>
+                                                {f'<span class="status-badge info" title="Last checked {result.get("cached_at", "N/A")}">Cached ({result.get("cache_status", "fresh")})</span>' if result.get('cached') else ''}
                                             </div>
                                         </div>
                                     </div>
@@ -503,7 +597,7 @@ class ReportHandler:
                                     <div style="flex: 0 0 auto; min-width: 150px; background: #f8f9fa; padding: 15px; border-radius: 8px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
                                         <div style="margin-bottom: 10px;">
                                             <span style="font-size: 0.9rem; color: #666;">Timestamp</span>
-                                            <div style="font-weight: 600;">{result.get('timestamp', 'N/A')}</div>
+                                            <div style="font-weight: 600;">{format_clock(result.get('start_time') or result.get('timestamp'))}</div>
                                         </div>
                                     </div>
                                 </div>
@@ -572,7 +666,8 @@ class ReportHandler:
                     'PASS': 'pass',
                     'SUCCESS': 'pass',
                     'FAIL': 'fail',
-                    'INFO': 'info'
+                    'INFO': 'info',
+                    'RETRY': 'info'
                 }.get(step['status'], 'info')
 
                 content += f"""
@@ -583,7 +678,7 @@ class ReportHandler:
                                                         {step['status']}
                                                     </span>
                                                 </td>
-                                                <td>{step['timestamp']}</td>
+                                                <td>{format_clock(step.get('timestamp'))}</td>
                                                 <td>{step['message']}</td>
                                             </tr>
                             """
@@ -594,6 +689,34 @@ class ReportHandler:
                                 </div>
                         """
 
+            # Navigation timing breakdown
+            if result.get('timing'):
+                content += """
+                                <div class="steps-section">
+                                    <h3 style="margin-bottom: 15px;">Navigation Timing</h3>
+                                    <table class="steps-table">
+                                        <thead>
+                                            <tr>
+                        """
+                for _, label in TIMING_FIELDS:
+                    content += f"""
+                                                <th>{label}</th>"""
+                content += """
+                                            </tr>
+                                        </thead>
+                                        <tbody>
+                                            <tr>"""
+                for key, _ in TIMING_FIELDS:
+                    value = NavigationTiming.format_field(result['timing'], key)
+                    content += f"""
+                                                <td>{'N/A' if value is None else f'{value:.2f}'}</td>"""
+                content += """
+                                            </tr>
+                                        </tbody>
+                                    </table>
+                                </div>
+                        """
+
             # Error section if any
             if result['status'] != 'Success' and result.get('error'):
                 content += f"""
@@ -624,17 +747,36 @@ class ReportHandler:
                             <div id="screenshot-container-{index}" class="screenshot-container">
                         """
 
-            # Screenshot handling
-            if result.get('screenshot') and os.path.exists(result['screenshot']):
+            # Screenshot handling; prefer the bytes captured during the run over re-reading the file
+            if ReportHandler.has_screenshot(result):
                 try:
-                    base64_image = ReportHandler.encode_image_to_base64(result['screenshot'])
-                    if base64_image:
+                    screenshot_key = result.get('screenshot_key') or result.get('thumbnail') or result.get('screenshot')
+                    image_source = None
+                    screenshot_script = ""
+                    if screenshot_refs is not None and screenshot_key in screenshot_refs:
+                        # Duplicate capture: reuse the image already embedded for another URL
+                        image_source = f'data-screenshot-ref="{screenshot_refs[screenshot_key]}"'
+                    else:
+                        base64_image = ReportHandler.get_screenshot_data_uri(result)
+                        if base64_image and screenshot_refs is not None:
+                            screenshot_ref = f"shot-{len(screenshot_refs)}"
+                            screenshot_refs[screenshot_key] = screenshot_ref
+                            image_source = f'data-screenshot-ref="{screenshot_ref}"'
+                            # Emitted with the first result that uses it, so the report is written in one pass
+                            screenshot_script = (f'<script>screenshotData["{screenshot_ref}"] = '
+                                                 f'{json.dumps(base64_image)};</script>')
+                        elif base64_image:
+                            image_source = f'src="{base64_image}"'
+
+                    if image_source:
                         content += f"""
                                         <div style="background: white; padding: 15px; border-radius: 8px;">
-                                            <img src="{base64_image}" 
+                                            <img {image_source} 
                                                  class="screenshot" 
                                                  alt="Test Screenshot"
                                                  loading="lazy" />
+                                            {ReportHandler.get_full_size_link(result)}
+                                            {screenshot_script}
                                         </div>
                                     """
                     else:
@@ -665,7 +807,7 @@ class ReportHandler:
             # Hidden test data
             content += f"""
                             <div id="test-data-{index}" style="display: none;">
-                                {json.dumps(result)}
+                                {json.dumps(ReportHandler.serializable_result(result))}
                             </div>
                         </div>
                         """
@@ -682,9 +824,37 @@ class ReportHandler:
                             </div>
                         """
 
+    @staticmethod
+    def generate_url_list_item(result, i):
+        """Left panel entry for a single test result"""
+        return f'''
+                        <li class="url-item" onclick="showContent({i})">
+                            <div class="url-item-content">
+                                <div class="url-info">
+                                    <span class="url-header">Validating URL: </span>
+                                    <span class="url-name">{result['url']}</span>
+                                </div>
+                                <div class="status-badge-container">
+                                    <span class="status-badge {
+        'pass' if result['status'] == 'Success' else 'fail'
+        }">
+                                        {'pass' if result['status'] == 'Success' else 'fail'}
+                                    </span>
+                                    {'<span class="status-badge info" style="margin-left: 5px;">cached</span>' if result.get('cached') else ''}
+                                </div>
+                            </div>
+                        </li>
+                    '''
+
     @staticmethod
     def generate_html_report(results):
-        """Generate complete HTML report from test results."""
+        """Generate complete HTML report from test results.
+
+        ``results`` may be any iterable, including a one-shot iterator or a
+        ResultSink, and is read once: the URL list and content panels are
+        spooled to temporary files while the statistics are gathered, then
+        the page is assembled with the stats bar first.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Setup directories
@@ -694,8 +864,32 @@ class ReportHandler:
             os.makedirs(report_dir)
 
         report_path = os.path.join(report_dir, f"TestReport_{timestamp}.html")
-        stats = ReportHandler.calculate_stats(results)
 
+        # Each distinct screenshot is embedded once
+        screenshot_refs = {}
+        list_spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+        content_spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+        def spooled(results):
+            for i, result in enumerate(results):
+                list_spool.write(ReportHandler.generate_url_list_item(result, i))
+                content_spool.write(ReportHandler.generate_content_section(result, i, screenshot_refs))
+                yield result
+
+        try:
+            stats = ReportHandler.calculate_stats(spooled(results))
+            list_spool.seek(0)
+            content_spool.seek(0)
+            ReportHandler._write_html_report(report_path, timestamp, stats, list_spool, content_spool)
+        finally:
+            list_spool.close()
+            content_spool.close()
+
+        return report_path
+
+    @staticmethod
+    def _write_html_report(report_path, timestamp, stats, list_spool, content_spool):
+        """Assemble the page around the spooled URL list and content panels"""
         # Determine pass rate color based on percentage
         def get_pass_rate_color():
             rate = stats['pass_rate']
@@ -708,28 +902,8 @@ class ReportHandler:
             else:
                 return "#228B22"  # Forest Green
 
-        # Generate URL list items
-        url_list_items = '''
-                    '''.join(f'''
-                        <li class="url-item" onclick="showContent({i})">
-                            <div class="url-item-content">
-                                <div class="url-info">
-                                    <span class="url-header">Validating URL: </span>
-                                    <span class="url-name">{result['url']}</span>
-                                </div>
-                                <div class="status-badge-container">
-                                    <span class="status-badge {
-        'pass' if result['status'] == 'Success' else 'fail'
-        }">
-                                        {'pass' if result['status'] == 'Success' else 'fail'}
-                                    </span>
-                                </div>
-                            </div>
-                        </li>
-                    ''' for i, result in enumerate(results))
-
-        # Generate HTML content
-        html_content = f"""
+        # Spooled sections are copied in chunks, so memory stays flat
+        html_head = f"""
                     <!DOCTYPE html>
                     <html lang="en">
                     <head>
@@ -744,6 +918,7 @@ class ReportHandler:
                                 color: {get_pass_rate_color()};
                             }}
                         </style>
+                        <script>const screenshotData = {{}};</script>
                     </head>
                     <body>
                         <div class="layout">
@@ -769,6 +944,14 @@ class ReportHandler:
                                     <div class="stat-label">Duration</div>
                                     <div class="stat-value">{ReportHandler.format_duration(stats['total_duration'])}</div>
                                 </div>
+                                <div class="stat-item profile">
+                                    <div class="stat-label">Run Profile</div>
+                                    <div class="stat-value">{stats['run_profile']}</div>
+                                </div>
+                                <div class="stat-item circuit" title="{', '.join(stats['circuit_hosts']) or 'No open circuits'}">
+                                    <div class="stat-label">Circuit Open</div>
+                                    <div class="stat-value">{stats['circuit_open']} URL(s) / {len(stats['circuit_hosts'])} host(s)</div>
+                                </div>
                             </div>
 
                             <!-- Main Content -->
@@ -805,15 +988,15 @@ class ReportHandler:
                                     </div>
 
                                     <ul class="url-list">
-                                        {url_list_items}
+                    """
+        html_middle = """
                                     </ul>
                                 </div>
 
                                 <!-- Right Panel -->
                                 <div class="right-panel">
-                                    {'''
-                                    '''.join(ReportHandler.generate_content_section(result, i)
-                                             for i, result in enumerate(results))}
+                    """
+        html_tail = f"""
                                 </div>
                             </div>
                         </div>
@@ -823,11 +1006,12 @@ class ReportHandler:
                     </html>
                 """
 
-        # Write report to file
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        return report_path
+            f.write(html_head)
+            shutil.copyfileobj(list_spool, f)
+            f.write(html_middle)
+            shutil.copyfileobj(content_spool, f)
+            f.write(html_tail)
 
     @staticmethod
     def create_data_viewer_html(data):
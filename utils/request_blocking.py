@@ -0,0 +1,60 @@
+# utils/request_blocking.py
+import json
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m3u8", "*.m4s"]
+TRACKER_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*connect.facebook.com*",
+    "*hotjar.com*", "*scorecardresearch.com*", "*adservice.google.*", "*clarity.ms*"
+]
+
+# Profile name -> URL patterns passed to Network.setBlockedURLs
+BLOCKING_PRESETS = {
+    "off": [],
+    "status-only": IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS,
+    "screenshot-fidelity": MEDIA_PATTERNS + TRACKER_PATTERNS
+}
+
+
+class RequestBlocker:
+    @staticmethod
+    def get_patterns(profile, custom_patterns=None):
+        """URL patterns to block for a profile; "custom" uses the configured patterns only"""
+        if profile == "custom":
+            return list(custom_patterns or [])
+        if profile not in BLOCKING_PRESETS:
+            raise ValueError(f"Unknown resource blocking profile: {profile}")
+        return BLOCKING_PRESETS[profile] + list(custom_patterns or [])
+
+    @staticmethod
+    def configure_options(chrome_options):
+        """Enable the performance log so blocked requests can be counted"""
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    @staticmethod
+    def apply(driver, patterns):
+        """Block matching requests for the lifetime of the browser session"""
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    @staticmethod
+    def count_blocked(driver):
+        """Count requests blocked since the performance log was last read.
+
+        Reading the log drains it, so call this once before navigating to
+        discard earlier events and once after the page is ready.
+        """
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            print(f"Error reading performance log: {str(e)}")
+            return 0
+
+        blocked = 0
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                blocked += 1
+        return blocked
@@ -0,0 +1,163 @@
+# utils/result_cache.py
+import copy
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import time
+from urllib.parse import urlsplit, urlunsplit
+from .config_handler import Configuration
+from .http_probe import HTTPProbe
+from .result_record import ResultRecord, StepRecord, StepStatus
+from .url_handler import URLHandler
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class ResultCache:
+    """Persistent cache of successful results for incremental runs.
+
+    Entries are keyed by normalized URL and keep the result together with
+    the page's ETag, Last-Modified and body hash and when it was checked.
+    URLs checked within ``ttl`` seconds are served from the cache; older
+    entries are revalidated with a conditional request when ``revalidate``
+    is on, and only changed or expired pages go through the browser.
+    """
+
+    def __init__(self, path=None, ttl=86400, revalidate=True, concurrency=16, revalidate_fn=None):
+        self.path = path
+        self.ttl = ttl
+        self.revalidate = revalidate
+        self.concurrency = max(1, int(concurrency))
+        self.revalidate_fn = revalidate_fn or HTTPProbe.revalidate
+        self._entries = self.load(path) if path else {}
+        self._validators = {}
+        self._updated = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls):
+        config = Configuration.get_config()
+        return cls(
+            path=config["result_cache_file"],
+            ttl=config["result_cache_ttl"],
+            revalidate=config["result_cache_revalidate"],
+            concurrency=config["result_cache_concurrency"]
+        )
+
+    @staticmethod
+    def normalize_url(url):
+        """Cache key: lower-case scheme and host, no default port, fragment or empty path"""
+        parts = urlsplit(URLHandler.format_url(url.strip()))
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{parts.port}"
+        return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+    @staticmethod
+    def load(path):
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f).get("entries", {})
+        except Exception as e:
+            print(f"Error reading result cache: {str(e)}")
+            return {}
+
+    @staticmethod
+    def cached_result(entry, cache_status):
+        """Copy of a cached result marked for the reports"""
+        result = copy.deepcopy(entry['result'])
+        checked = datetime.fromtimestamp(entry['checked_at']).strftime('%Y-%m-%d %H:%M:%S')
+        result['cached'] = True
+        result['cache_status'] = cache_status
+        result['cached_at'] = checked
+        result.setdefault('steps', []).append(StepRecord(
+            StepStatus.INFO,
+            f"Served from result cache ({cache_status}); last checked {checked}"
+        ))
+        return result
+
+    def _check(self, url):
+        """Cached result for a URL, or None when it has to be processed"""
+        key = self.normalize_url(url)
+        entry = self._entries.get(key)
+        if not entry:
+            return None
+        if time() - entry['checked_at'] < self.ttl:
+            return self.cached_result(entry, 'fresh')
+        if not self.revalidate:
+            return None
+
+        check = self.revalidate_fn(url, etag=entry.get('etag'), last_modified=entry.get('last_modified'),
+                                   content_hash=entry.get('content_hash'))
+        with self._lock:
+            if check['changed']:
+                # Kept so the entry written after the browser run can be revalidated next time
+                self._validators[key] = {name: check[name] for name in ('etag', 'last_modified', 'content_hash')}
+                return None
+            entry['checked_at'] = time()
+            for name in ('etag', 'last_modified', 'content_hash'):
+                entry[name] = check[name] or entry.get(name)
+            self._updated[key] = entry
+        return self.cached_result(entry, 'revalidated')
+
+    def partition(self, urls):
+        """Split (url, row_number) pairs into URLs to process and cached results by row"""
+        to_process = []
+        cached = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="cache") as executor:
+            checks = list(executor.map(lambda item: self._check(item[0]), urls))
+        for (url, row_number), result in zip(urls, checks):
+            if result is None:
+                to_process.append((url, row_number))
+            else:
+                cached[row_number] = result
+        return to_process, cached
+
+    def update(self, urls, results):
+        """Cache successful results; failures are always checked again"""
+        for (url, _), result in zip(urls, results):
+            if result.get('status') != 'Success' or result.get('cached'):
+                continue
+            key = self.normalize_url(url)
+            with self._lock:
+                validators = self._validators.pop(key, {})
+            preflight = result.get('preflight') or {}
+            entry = {
+                'url': key,
+                'status': result['status'],
+                'etag': preflight.get('etag') or validators.get('etag'),
+                'last_modified': preflight.get('last_modified') or validators.get('last_modified'),
+                'content_hash': validators.get('content_hash'),
+                'checked_at': time(),
+                'result': ResultRecord.as_dict(result)
+            }
+            with self._lock:
+                self._entries[key] = entry
+                self._updated[key] = entry
+
+    def save(self):
+        """Merge updated entries into the cache file and replace it atomically"""
+        if not self.path:
+            return
+        with self._lock:
+            updated, self._updated = self._updated, {}
+        if not updated:
+            return
+
+        try:
+            merged = self.load(self.path)
+            merged.update(updated)
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": merged}, f, default=str)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving result cache: {str(e)}")
@@ -0,0 +1,141 @@
+# utils/result_record.py
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime
+from enum import Enum
+from time import time, monotonic
+
+# Converts monotonic step timestamps to wall-clock time when they are reported
+MONOTONIC_EPOCH = time() - monotonic()
+
+
+def format_clock(value):
+    """'HH:MM:SS' for an epoch timestamp; journals from older runs already hold the string"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).strftime('%H:%M:%S')
+    return value or 'N/A'
+
+
+class StepStatus(str, Enum):
+    INFO = 'INFO'
+    SUCCESS = 'SUCCESS'
+    PASS = 'PASS'
+    FAIL = 'FAIL'
+    FATAL = 'FATAL'
+    RETRY = 'RETRY'
+
+    # Compares, formats and serializes as the plain status string
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class StepRecord(Mapping):
+    """One processing step, read like the ``{'status', 'timestamp', 'message'}`` dicts it replaces.
+
+    ``timestamp`` is stored as a raw ``monotonic()`` reading; the mapping
+    view returns it as epoch seconds and reports format it with format_clock.
+    """
+
+    __slots__ = ('status', 'message', 'timestamp')
+    KEYS = ('status', 'timestamp', 'message')
+
+    def __init__(self, status, message, timestamp=None):
+        self.status = StepStatus(status)
+        self.message = message
+        self.timestamp = monotonic() if timestamp is None else timestamp
+
+    def __getitem__(self, key):
+        if key == 'timestamp':
+            return MONOTONIC_EPOCH + self.timestamp
+        if key in ('status', 'message'):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return f"StepRecord({self.status.value!r}, {self.message!r})"
+
+    def to_dict(self):
+        return {'status': self.status.value, 'timestamp': self['timestamp'], 'message': self.message}
+
+
+class ResultRecord(MutableMapping):
+    """A URL's result with its common fields in slots, usable wherever a result dict is.
+
+    A field that was never set is absent, as a missing dict key would be.
+    Less common fields live in a small dict created on first use. Screenshot
+    fields are slots because the screenshot writer threads set them while
+    the worker is still adding steps.
+    """
+
+    __slots__ = (
+        'url', 'status', 'load_time', 'error', 'start_time', 'end_time', 'run_profile', 'steps',
+        'attempts', 'screenshot', 'screenshot_key', 'screenshot_data', 'thumbnail', 'thumbnail_data',
+        'thumbnail_format', '_extra'
+    )
+    FIELDS = __slots__[:-1]
+    _FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        try:
+            return self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+            return
+        try:
+            self._extra[key] = value
+        except AttributeError:
+            self._extra = {key: value}
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        try:
+            del self._extra[key]
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        yield from getattr(self, '_extra', ())
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"ResultRecord({dict(self)!r})"
+
+    def to_dict(self):
+        return self.as_dict(self)
+
+    @staticmethod
+    def as_dict(result):
+        """Plain-dict copy of a result or record for JSON, without in-memory binary fields"""
+        data = {key: value for key, value in result.items() if not isinstance(value, bytes)}
+        if data.get('steps'):
+            data['steps'] = [step.to_dict() if isinstance(step, StepRecord) else step
+                             for step in data['steps']]
+        return data
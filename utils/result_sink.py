@@ -0,0 +1,92 @@
+# utils/result_sink.py
+import json
+from .run_journal import RunJournal
+
+
+class ResultSink:
+    """Row-ordered, re-iterable view of the results recorded in the run journal.
+
+    Completed results are streamed to the journal's JSONL files as they
+    finish; this reads them back in the order of ``urls`` without holding
+    them in memory. Only a row -> (file, byte offset) index is kept. Rows
+    with no journaled result for the same URL come back as failed results.
+    """
+
+    def __init__(self, directory, urls):
+        self.directory = directory
+        self.urls = urls
+        self._files = []
+        self._index = None
+
+    def _build_index(self):
+        """Scan the journal files once, remembering where each row's latest record starts"""
+        self._files = RunJournal.journal_files(self.directory)
+        index = {}
+        for file_number, path in enumerate(self._files):
+            with open(path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if line.endswith(b"\n"):
+                        try:
+                            # Only the row number is needed here; avoid decoding the whole record
+                            row = int(line[8:line.index(b",")]) if line.startswith(b'{"row": ') else None
+                        except ValueError:
+                            row = None
+                        if row is not None:
+                            index[row] = (file_number, offset)
+                    offset += len(line)
+        return index
+
+    def refresh(self):
+        """Pick up results journaled since the index was built"""
+        self._index = self._build_index()
+
+    def _read(self, handles, location):
+        file_number, offset = location
+        handle = handles.get(file_number)
+        if handle is None:
+            handle = handles[file_number] = open(self._files[file_number], "r", encoding="utf-8")
+        handle.seek(offset)
+        try:
+            return json.loads(handle.readline())
+        except ValueError:
+            return None
+
+    def records(self):
+        """Yield ``(url, row_number, result)``, with ``result`` None for rows not yet completed"""
+        if self._index is None:
+            self.refresh()
+        handles = {}
+        try:
+            for url, row_number in self.urls:
+                location = self._index.get(row_number)
+                record = self._read(handles, location) if location else None
+                if record and record['url'] == url:
+                    yield url, row_number, record['result']
+                else:
+                    yield url, row_number, None
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    def pending(self):
+        """(url, row_number) pairs that have no journaled result yet"""
+        return [(url, row_number) for url, row_number, result in self.records() if result is None]
+
+    @staticmethod
+    def missing_result(url):
+        """Failed result reported for a row that was never journaled"""
+        return {
+            'url': url,
+            'status': 'Failed',
+            'error': "No result recorded for this row",
+            'load_time': 0,
+            'steps': []
+        }
+
+    def __iter__(self):
+        for url, _, result in self.records():
+            yield result if result is not None else self.missing_result(url)
+
+    def __len__(self):
+        return len(self.urls)
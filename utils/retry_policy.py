@@ -0,0 +1,47 @@
+# utils/retry_policy.py
+import random
+import re
+from .config_handler import Configuration
+
+# Failures worth another attempt: timeouts, dropped connections and gateway errors
+TRANSIENT_ERROR_REGEX = re.compile(
+    r"timeout|timed out|connection was reset|err_connection_reset|"
+    r"server returned empty response|err_empty_response|\bhttp 50[234]\b",
+    re.IGNORECASE
+)
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=2, retry_delay=2, backoff_factor=2, max_delay=60, jitter=0.5):
+        self.max_retries = max(0, int(max_retries))
+        self.retry_delay = retry_delay
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    @classmethod
+    def from_config(cls):
+        """Create a policy from config.json settings"""
+        config = Configuration.get_config()
+        return cls(
+            max_retries=config["max_retries"],
+            retry_delay=config["retry_delay"],
+            backoff_factor=config["retry_backoff_factor"],
+            max_delay=config["retry_max_delay"]
+        )
+
+    @staticmethod
+    def is_transient(result):
+        """Check whether a failed result looks like a temporary problem"""
+        if result.get('status') == 'Success' or not result.get('error'):
+            return False
+        return bool(TRANSIENT_ERROR_REGEX.search(str(result['error'])))
+
+    def should_retry(self, result, attempt):
+        """Check whether a result from the given 1-based attempt should be retried"""
+        return attempt <= self.max_retries and self.is_transient(result)
+
+    def get_delay(self, attempt):
+        """Exponential backoff with jitter before the attempt after ``attempt``"""
+        delay = min(self.max_delay, self.retry_delay * (self.backoff_factor ** (attempt - 1)))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
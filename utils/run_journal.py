@@ -0,0 +1,162 @@
+# utils/run_journal.py
+import glob
+import json
+import os
+import threading
+from time import monotonic
+from .config_handler import Configuration
+from .result_record import ResultRecord
+
+
+class RunJournal:
+    """Append-only JSONL record of completed results, for resuming a crashed run.
+
+    Each process appends to its own ``journal_<pid>.jsonl`` in ``directory``,
+    so shards never interleave writes. Every record is flushed to the OS
+    immediately; ``fsync`` is batched every ``fsync_batch`` records or
+    ``fsync_interval`` seconds, whichever comes first.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directory, fsync_batch=20, fsync_interval=2):
+        self.directory = directory
+        self.fsync_batch = max(1, int(fsync_batch))
+        self.fsync_interval = fsync_interval
+        self.path = os.path.join(directory, f"journal_{os.getpid()}.jsonl")
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Get this process's journal configured from config.json"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                config = Configuration.get_config()
+                cls._shared = cls(
+                    config["journal_dir"],
+                    fsync_batch=config["journal_fsync_batch"],
+                    fsync_interval=config["journal_fsync_interval"]
+                )
+            return cls._shared
+
+    @classmethod
+    def sync_shared(cls):
+        with cls._shared_lock:
+            journal = cls._shared
+        if journal:
+            journal.sync()
+
+    @classmethod
+    def close_shared(cls):
+        with cls._shared_lock:
+            journal, cls._shared = cls._shared, None
+        if journal:
+            journal.close()
+
+    @staticmethod
+    def journal_files(directory):
+        """Journal files oldest-modified first, so a row's record in the newest file wins.
+
+        File names carry the pid, which says nothing about which run wrote later.
+        """
+        paths = []
+        for path in glob.glob(os.path.join(directory, "journal_*.jsonl")):
+            try:
+                paths.append((os.stat(path).st_mtime_ns, path))
+            except OSError:
+                continue
+        return [path for _, path in sorted(paths)]
+
+    @classmethod
+    def reset(cls, directory):
+        """Remove journals of a previous run before starting a fresh one"""
+        # The shared journal may still hold one of these files open
+        cls.close_shared()
+        for path in cls.journal_files(directory):
+            try:
+                os.remove(path)
+            except Exception as e:
+                print(f"Error removing journal {path}: {str(e)}")
+
+    @staticmethod
+    def load(directory):
+        """Completed results keyed by row number from every journal in ``directory``.
+
+        A record cut short by a crash is skipped; that row simply runs again.
+        """
+        completed = {}
+        for path in RunJournal.journal_files(directory):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    completed[record['row']] = record
+        return completed
+
+    @staticmethod
+    def split_completed(urls, completed):
+        """Split (url, row_number) pairs into rows still to run and journaled results by row.
+
+        A row only counts as done if it was journaled for the same URL.
+        """
+        pending = []
+        done = {}
+        for url, row_number in urls:
+            record = completed.get(row_number)
+            if record and record['url'] == url:
+                done[row_number] = record['result']
+            else:
+                pending.append((url, row_number))
+        return pending, done
+
+    @staticmethod
+    def merge(urls, done, new_results):
+        """Combine journaled and new results back into row order"""
+        new_results = iter(new_results)
+        return [done[row_number] if row_number in done else next(new_results)
+                for _, row_number in urls]
+
+    def append(self, row_number, url, result):
+        """Record a completed result; binary screenshot data is left out"""
+        # 'row' stays the first key: ResultSink indexes rows without parsing whole records
+        record = {
+            'row': row_number,
+            'url': url,
+            'result': ResultRecord.as_dict(result)
+        }
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                if not os.path.exists(self.directory):
+                    os.makedirs(self.directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_batch or monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = monotonic()
+
+    def sync(self):
+        """Force buffered records to disk"""
+        with self._lock:
+            if self._file and self._unsynced:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                if self._unsynced:
+                    self._sync()
+                self._file.close()
+                self._file = None
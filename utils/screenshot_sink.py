@@ -0,0 +1,180 @@
+# utils/screenshot_sink.py
+import os
+import queue
+import threading
+import allure
+
+
+class ScreenshotSink:
+    """Writes screenshots and Allure attachments on background threads.
+
+    ``submit`` blocks once ``max_queue`` screenshots are waiting, so a slow
+    disk throttles the browser workers instead of growing memory. With a
+    ``store``, duplicate captures are written and attached only once.
+    """
+
+    def __init__(self, writers=2, max_queue=32, processor=None, store=None):
+        self.processor = processor
+        self.store = store
+        # id(result) -> [queued screenshots, callbacks to run once they are written]
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._threads = []
+        for index in range(max(1, int(writers))):
+            thread = threading.Thread(target=self._drain, name=f"screenshot-writer-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, png, filepath, attachment_name=None, result=None):
+        """Queue a screenshot for writing, waiting while the queue is full.
+
+        When ``result`` is given, its ``screenshot``/``thumbnail`` paths and
+        ``thumbnail_data`` are filled in once the files are written.
+        """
+        if result is not None:
+            with self._pending_lock:
+                self._pending.setdefault(id(result), [0, []])[0] += 1
+        self._queue.put((png, filepath, attachment_name, result))
+
+    def when_written(self, result, callback):
+        """Call ``callback`` once every screenshot queued for ``result`` is written"""
+        with self._pending_lock:
+            pending = self._pending.get(id(result))
+            if pending:
+                pending[1].append(callback)
+                return
+        callback()
+
+    def _finish(self, result):
+        if result is None:
+            return
+        with self._pending_lock:
+            pending = self._pending[id(result)]
+            pending[0] -= 1
+            if pending[0]:
+                return
+            callbacks = self._pending.pop(id(result))[1]
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in screenshot callback: {str(e)}")
+
+    def _drain(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                try:
+                    self._write(*job)
+                finally:
+                    self._finish(job[3])
+            finally:
+                self._queue.task_done()
+
+    def _process(self, png, filepath):
+        if self.processor:
+            try:
+                return self.processor.process(png, filepath)
+            except Exception as e:
+                print(f"Error post-processing screenshot, keeping original PNG: {str(e)}")
+        return [('screenshot', filepath, png, 'png')]
+
+    def _write(self, png, filepath, attachment_name, result):
+        key = None
+        reserved = None
+        try:
+            if self.store:
+                entry, is_new = self.store.resolve(png)
+                if not is_new:
+                    outputs = self.store.wait(entry)
+                    if outputs:
+                        # Same page as an earlier capture: reference its files, write nothing.
+                        # The store keeps no bytes; the report reads these files back from disk
+                        self._record(result, entry['key'],
+                                     [(kind, path, None, image_format) for kind, path, image_format in outputs])
+                        if result is not None:
+                            result.pop('screenshot_data', None)
+                        return
+                else:
+                    reserved = entry
+                    key = entry['key']
+                    # Content-addressed name so identical captures share one file across runs
+                    filepath = os.path.join(os.path.dirname(filepath), f"{key[:32]}.png")
+
+            outputs = self._process(png, filepath)
+
+            for _, path, data, _ in outputs:
+                directory = os.path.dirname(path)
+                if directory and not os.path.exists(directory):
+                    os.makedirs(directory, exist_ok=True)
+                if key and os.path.exists(path):
+                    continue
+                with open(path, 'wb') as f:
+                    f.write(data)
+
+            self._record(result, key, outputs)
+
+            # One attachment per capture: the full-size image when kept, else the thumbnail
+            if attachment_name:
+                _, _, data, image_format = outputs[0]
+                self._attach(data, attachment_name, image_format)
+
+            if reserved:
+                self.store.complete(reserved, outputs)
+                reserved = None
+        except Exception as e:
+            print(f"Error writing screenshot {filepath}: {str(e)}")
+            allure.attach(
+                body=f"Error writing screenshot {filepath}: {str(e)}",
+                name="Screenshot Error",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        finally:
+            if reserved:
+                # Release duplicates waiting on a capture that failed to write
+                self.store.complete(reserved, [])
+
+    @staticmethod
+    def _record(result, key, outputs):
+        """Point a result at the written files and keep a freshly written thumbnail in memory"""
+        if result is None:
+            return
+        if key:
+            result['screenshot_key'] = key
+        for kind, path, data, image_format in outputs:
+            result[kind] = path
+            if kind == 'thumbnail':
+                result['thumbnail_format'] = image_format
+                if data is not None:
+                    result['thumbnail_data'] = data
+
+        if any(kind == 'thumbnail' for kind, _, _, _ in outputs):
+            # The report uses the thumbnail; the full-size bytes are no longer needed in memory
+            result.pop('screenshot_data', None)
+            if not any(kind == 'screenshot' for kind, _, _, _ in outputs):
+                result['screenshot'] = result['thumbnail']
+
+    @staticmethod
+    def _attach(data, name, image_format):
+        if image_format == 'png':
+            allure.attach(data, name=name, attachment_type=allure.attachment_type.PNG)
+        elif image_format == 'jpeg':
+            allure.attach(data, name=name, attachment_type=allure.attachment_type.JPG)
+        else:
+            allure.attach(data, name=name, extension=image_format)
+
+    def flush(self):
+        """Wait until every queued screenshot has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending screenshots and stop the writer threads"""
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
@@ -0,0 +1,125 @@
+# utils/screenshot_store.py
+import hashlib
+import io
+import math
+import threading
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; only byte-identical screenshots are deduplicated then
+    Image = None
+
+
+class ScreenshotStore:
+    """Content-addressed index of screenshots written during a run.
+
+    Captures are keyed by SHA-256 of the PNG bytes, so by default only
+    byte-identical captures share files. With ``near_duplicates`` (requires
+    Pillow), a 256-bit difference hash also matches captures at most
+    ``phash_threshold`` bits apart; candidates come from a band index rather
+    than a scan of every entry. Entries keep file paths and formats only,
+    never image bytes, so memory does not grow with the screenshots written.
+    """
+
+    HASH_SIZE = 16
+    BRIGHTNESS_TOLERANCE = 2
+
+    def __init__(self, near_duplicates=False, phash_threshold=2):
+        self.near_duplicates = bool(near_duplicates) and Image is not None
+        self.phash_threshold = max(0, int(phash_threshold))
+        # Hashes within the threshold agree exactly on at least one of threshold + 1 bands
+        self._band_bits = math.ceil(self.HASH_SIZE * self.HASH_SIZE / (self.phash_threshold + 1))
+        self._entries = {}
+        self._band_index = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(png):
+        return hashlib.sha256(png).hexdigest()
+
+    @classmethod
+    def perceptual_hash(cls, png):
+        """Difference hash of a 17x16 grayscale thumbnail, plus its mean brightness.
+
+        The brightness keeps flat pages of different colours, which all have
+        an empty difference hash, from matching each other.
+        """
+        if Image is None:
+            return None
+        size = cls.HASH_SIZE
+        with Image.open(io.BytesIO(png)) as image:
+            pixels = image.convert("L").resize((size + 1, size), Image.LANCZOS).tobytes()
+        value = 0
+        for row in range(size):
+            for col in range(size):
+                left = pixels[row * (size + 1) + col]
+                right = pixels[row * (size + 1) + col + 1]
+                value = (value << 1) | (1 if left > right else 0)
+        return value, sum(pixels) / len(pixels)
+
+    def _bands(self, value):
+        mask = (1 << self._band_bits) - 1
+        return [(band, (value >> (band * self._band_bits)) & mask)
+                for band in range(self.phash_threshold + 1)]
+
+    def _find_similar(self, phash):
+        value, brightness = phash
+        for band in self._bands(value):
+            for (other_value, other_brightness), key in self._band_index.get(band, ()):
+                if (bin(value ^ other_value).count("1") <= self.phash_threshold
+                        and abs(brightness - other_brightness) <= self.BRIGHTNESS_TOLERANCE):
+                    return key
+        return None
+
+    def resolve(self, png):
+        """Find the stored entry for a capture or reserve a new one.
+
+        Returns ``(entry, is_new)``. When ``is_new`` is true the caller must
+        write the files and then call ``complete``; otherwise ``wait`` on the
+        entry yields the ``(kind, path, image_format)`` outputs already
+        stored for a matching capture.
+        """
+        key = self.content_hash(png)
+        phash = None
+        if self.near_duplicates:
+            try:
+                phash = self.perceptual_hash(png)
+            except Exception:
+                phash = None
+
+        with self._lock:
+            existing_key = key if key in self._entries else None
+            if existing_key is None and phash is not None:
+                existing_key = self._find_similar(phash)
+            if existing_key:
+                entry = self._entries[existing_key]
+                entry['hits'] += 1
+                return entry, False
+
+            entry = {'key': key, 'outputs': [], 'hits': 1, 'ready': threading.Event()}
+            self._entries[key] = entry
+            if phash is not None:
+                for band in self._bands(phash[0]):
+                    self._band_index.setdefault(band, []).append((phash, key))
+            return entry, True
+
+    @staticmethod
+    def complete(entry, outputs):
+        """Record the files written for a new entry and release waiting duplicates.
+
+        ``outputs`` are ``(kind, path, data, image_format)``; the data is not kept.
+        """
+        entry['outputs'] = [(kind, path, image_format) for kind, path, _, image_format in outputs]
+        entry['ready'].set()
+
+    @staticmethod
+    def wait(entry, timeout=60):
+        entry['ready'].wait(timeout)
+        return entry['outputs']
+
+    def stats(self):
+        """Unique screenshots stored and duplicate captures suppressed"""
+        with self._lock:
+            unique = len(self._entries)
+            total = sum(entry['hits'] for entry in self._entries.values())
+        return {'unique': unique, 'duplicates': total - unique}
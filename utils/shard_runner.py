@@ -0,0 +1,109 @@
+# utils/shard_runner.py
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+import allure
+from .config_handler import Configuration
+from .http_probe import HTTPProbe
+from .concurrent_runner import ConcurrentRunner
+from .history_store import HistoryStore
+from .result_sink import ResultSink
+from .run_journal import RunJournal
+from .web_handler import WebAutomation
+
+
+class ShardRunner:
+    @staticmethod
+    def split_shards(urls, shard_count):
+        """Split (url, row_number) pairs into contiguous, evenly sized shards"""
+        shard_count = max(1, min(shard_count, len(urls)))
+        size, remainder = divmod(len(urls), shard_count)
+        shards = []
+        start = 0
+        for index in range(shard_count):
+            end = start + size + (1 if index < remainder else 0)
+            shards.append(urls[start:end])
+            start = end
+        return shards
+
+    @staticmethod
+    def run_shard(shard_index, urls, max_workers):
+        """Process one shard in a child process with its own browser workers"""
+        print(f"Shard {shard_index + 1}: processing {len(urls)} URLs")
+        try:
+            return ConcurrentRunner.run(urls, max_workers=max_workers)
+        finally:
+            WebAutomation.shutdown_driver_pool()
+            WebAutomation.shutdown_screenshot_sink()
+            HTTPProbe.close_session()
+            RunJournal.close_shared()
+            HistoryStore.close_shared()
+
+    @staticmethod
+    def run(urls, shard_count=None, max_workers=None):
+        """Process URLs across separate OS processes and merge results in row order.
+
+        Each shard gets its own process pool so a crashed Chrome or worker
+        process only fails the URLs of that shard. With stream_results on,
+        shards write to the run journal and an empty list is returned.
+        """
+        config = Configuration.get_config()
+        shard_count = int(shard_count or config["shard_count"])
+        max_workers = max_workers or config["max_workers"]
+
+        if shard_count <= 1 or len(urls) <= 1:
+            return ConcurrentRunner.run(urls, max_workers=max_workers)
+
+        shards = ShardRunner.split_shards(urls, shard_count)
+        print(f"Processing {len(urls)} URLs in {len(shards)} shards "
+              f"with {max_workers} worker(s) each")
+
+        # Shards record history under the caller's run; rows lost with a crashed shard are added here
+        history = HistoryStore.get_shared() if config["history_enabled"] else None
+        run_id = history.current_run_id() if history else None
+
+        context = multiprocessing.get_context("spawn")
+        executors = []
+        futures = []
+        try:
+            for shard_index, shard in enumerate(shards):
+                executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+                executors.append(executor)
+                futures.append(executor.submit(ShardRunner.run_shard, shard_index, shard, max_workers))
+
+            results = []
+            for shard_index, (shard, future) in enumerate(zip(shards, futures)):
+                shard_start_time = time()
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    error_msg = f"Shard {shard_index + 1} crashed: {str(e)}"
+                    print(error_msg)
+                    allure.attach(
+                        body=error_msg,
+                        name=f"Shard Error {shard_index + 1}",
+                        attachment_type=allure.attachment_type.TEXT
+                    )
+                    # Rows the shard journaled before crashing keep their results
+                    failed_urls = (ResultSink(config["journal_dir"], shard).pending()
+                                   if config["stream_results"] else shard)
+                    failed = [
+                        (url, row_number, ConcurrentRunner.build_failed_result(url, error_msg, shard_start_time))
+                        for url, row_number in failed_urls
+                    ]
+                    if config["stream_results"]:
+                        journal = RunJournal.get_shared()
+                        for url, row_number, result in failed:
+                            journal.append(row_number, url, result)
+                    else:
+                        results.extend(result for _, _, result in failed)
+                    if run_id is not None:
+                        recorded = history.recorded_rows(run_id)
+                        for url, row_number, result in failed:
+                            if row_number not in recorded:
+                                history.add(row_number, url, result, run_id=run_id)
+            return results
+
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
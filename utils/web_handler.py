@@ -2,16 +2,44 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import JavascriptException, TimeoutException
 import allure
 from time import time, sleep
 import os
+import threading
 from datetime import datetime
 from .config_handler import Configuration
+from .driver_pool import DriverPool
+from .error_patterns import NET_ERROR_REGEX, format_http_error, match_content_error, match_net_error
+from .http_probe import HTTPProbe
+from .image_handler import ScreenshotProcessor
+from .latency_history import LatencyHistory
+from .navigation_timing import NavigationTiming
+from .page_readiness import PageReadiness
+from .profiler import Profiler
+from .request_blocking import RequestBlocker
+from .result_record import ResultRecord, StepRecord, StepStatus
+from .screenshot_sink import ScreenshotSink
+from .screenshot_store import ScreenshotStore
 from .url_handler import URLHandler
 
+# Gathers everything check_page_errors needs in a single script call
+PAGE_ERROR_SCRIPT = """
+const netErrorRegex = new RegExp(arguments[0], 'i');
+const sampleChars = arguments[1];
+const root = document.documentElement;
+const netError = root ? root.outerHTML.match(netErrorRegex) : null;
+const navigation = performance.getEntriesByType('navigation')[0];
+return {
+    netError: netError ? netError[0] : null,
+    responseStatus: navigation && navigation.responseStatus ? navigation.responseStatus : null,
+    title: document.title || '',
+    bodyText: document.body ? document.body.innerText.slice(0, sampleChars) : ''
+};
+"""
+
 
 class WebDriverSetup:
     @staticmethod
@@ -24,7 +52,16 @@ class WebDriverSetup:
             chrome_options.add_argument("--ignore-certificate-errors")
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--remote-allow-origins=*")
-            chrome_options.add_argument("--start-maximized")
+
+            # Run profile: window mode and page load strategy
+            profile = Configuration.get_run_profile()
+            if profile["headless"]:
+                chrome_options.add_argument("--headless=new")
+            if profile["window_size"]:
+                chrome_options.add_argument(f"--window-size={profile['window_size']}")
+            elif not profile["headless"]:
+                chrome_options.add_argument("--start-maximized")
+            chrome_options.page_load_strategy = profile["page_load_strategy"]
 
             # Additional stability options
             chrome_options.add_argument("--disable-gpu")
@@ -32,6 +69,14 @@ class WebDriverSetup:
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-popup-blocking")
 
+            # Resource blocking needs the performance log to count blocked requests
+            config = Configuration.get_config()
+            blocked_patterns = RequestBlocker.get_patterns(
+                config["resource_blocking"], config["blocked_url_patterns"]
+            )
+            if blocked_patterns:
+                RequestBlocker.configure_options(chrome_options)
+
             # Get Chrome driver path from configuration
             chrome_driver_path = Configuration.get_path("chrome_driver")
 
@@ -42,7 +87,12 @@ class WebDriverSetup:
 
             service = Service(executable_path=chrome_driver_path)
             driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.set_page_load_timeout(Configuration.get_config()["page_load_timeout"])
+            driver.set_page_load_timeout(config["page_load_timeout"])
+
+            if blocked_patterns:
+                RequestBlocker.apply(driver, blocked_patterns)
+                print(f"Blocking {len(blocked_patterns)} URL pattern(s) "
+                      f"(profile: {config['resource_blocking']})")
 
             print("Chrome WebDriver initialized successfully")
             return driver
@@ -59,15 +109,111 @@ class WebDriverSetup:
 
 
 class WebAutomation:
+    _driver_pool = None
+    _screenshot_sink = None
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def get_driver_pool(cls):
+        """Get the shared driver pool, creating it from configuration on first use"""
+        with cls._pool_lock:
+            if cls._driver_pool is None:
+                config = Configuration.get_config()
+                cls._driver_pool = DriverPool(
+                    WebDriverSetup.create_driver,
+                    # One browser per worker at minimum so workers never queue on the pool
+                    size=max(config["driver_pool_size"], config["max_workers"]),
+                    max_uses=config["driver_max_uses"],
+                    acquire_timeout=config["driver_acquire_timeout"]
+                )
+            return cls._driver_pool
+
+    @classmethod
+    def shutdown_driver_pool(cls):
+        """Quit all pooled browsers"""
+        with cls._pool_lock:
+            pool, cls._driver_pool = cls._driver_pool, None
+        if pool:
+            pool.close()
+
+    @classmethod
+    def get_screenshot_sink(cls):
+        """Get the shared background screenshot writer"""
+        with cls._pool_lock:
+            if cls._screenshot_sink is None:
+                config = Configuration.get_config()
+                cls._screenshot_sink = ScreenshotSink(
+                    writers=config["screenshot_writer_threads"],
+                    max_queue=config["screenshot_queue_size"],
+                    processor=ScreenshotProcessor.from_config(),
+                    store=ScreenshotStore(
+                        near_duplicates=config["screenshot_near_duplicates"],
+                        phash_threshold=config["screenshot_phash_threshold"]
+                    ) if config["screenshot_dedup"] else None
+                )
+            return cls._screenshot_sink
+
+    @classmethod
+    def flush_screenshot_sink(cls):
+        """Wait for all queued screenshots to be written"""
+        sink = cls._screenshot_sink
+        if sink:
+            sink.flush()
+
+    @classmethod
+    def when_screenshots_written(cls, result, callback):
+        """Run ``callback`` once the result's queued screenshots are on disk"""
+        sink = cls._screenshot_sink
+        if sink:
+            sink.when_written(result, callback)
+        else:
+            callback()
+
+    @classmethod
+    def shutdown_screenshot_sink(cls):
+        """Flush queued screenshots and stop the writer threads"""
+        with cls._pool_lock:
+            sink, cls._screenshot_sink = cls._screenshot_sink, None
+        if sink:
+            sink.close()
+
     @staticmethod
-    def check_page_loaded(driver, timeout=30):
-        """Checks if page is completely loaded"""
+    def check_page_loaded(driver, timeout=30, previous_href=None):
+        """Checks if page is completely loaded and has stopped changing.
+
+        ``previous_href`` is the page the driver showed before ``driver.get``;
+        under the "none" strategy readiness waits until it has been left.
+        """
+        config = Configuration.get_config()
+        strategy = Configuration.get_run_profile()["page_load_strategy"]
         try:
             print(f"Waiting for page to load (timeout: {timeout}s)...")
-            WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            sleep(2)
+            if strategy == "none":
+                # driver.get returned before navigation started; wait to leave the previous page
+                # (about:blank for pooled browsers, data:, for a fresh session)
+                previous_href = previous_href or "about:blank"
+                WebDriverWait(driver, timeout).until(
+                    lambda d: d.execute_script("return location.href") != previous_href
+                )
+
+            try:
+                state = PageReadiness.wait_until_stable(
+                    driver,
+                    timeout=timeout,
+                    quiet_ms=config["readiness_quiet_ms"],
+                    max_quiet_wait=config["readiness_max_quiet_wait"],
+                    require_complete=strategy == "normal"
+                )
+                loaded = state['complete']
+            except JavascriptException:
+                # The page navigated away mid-check (e.g. a client-side redirect)
+                WebDriverWait(driver, timeout).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+                loaded = True
+
+            if not loaded:
+                raise TimeoutException(f"Page did not finish loading within {timeout}s")
             print("Page load complete")
             return True
         except Exception as e:
@@ -82,68 +228,43 @@ class WebAutomation:
     @staticmethod
     def check_page_errors(driver):
         """Check for common error patterns on the page"""
-        error_patterns = {
-            '404': ['404', 'page not found', 'not found', '404 error'],
-            '403': ['403', 'forbidden', 'access denied', '403 error'],
-            '500': ['500', 'internal server error', 'server error', '500 error'],
-            '502': ['502', 'bad gateway', '502 error'],
-            '503': ['503', 'service unavailable', '503 error'],
-            '504': ['504', 'gateway timeout', '504 error']
-        }
-
-        error_mappings = {
-            'ERR_NAME_NOT_RESOLVED': 'DNS resolution failed - Unable to resolve domain name',
-            'ERR_CONNECTION_REFUSED': 'Connection refused by the server',
-            'ERR_CONNECTION_TIMED_OUT': 'Connection timed out',
-            'ERR_NETWORK_UNREACHABLE': 'Network is unreachable',
-            'ERR_CONNECTION_RESET': 'Connection was reset',
-            'ERR_SSL_PROTOCOL_ERROR': 'SSL/TLS protocol error',
-            'ERR_CERT_AUTHORITY_INVALID': 'Invalid SSL certificate',
-            'ERR_BAD_SSL_CLIENT_AUTH_CERT': 'Invalid client SSL certificate',
-            'ERR_TUNNEL_CONNECTION_FAILED': 'Failed to establish tunnel connection',
-            'ERR_NO_SUPPORTED_PROXIES': 'No supported proxies',
-            'ERR_EMPTY_RESPONSE': 'Server returned empty response',
-            'ERR_RESPONSE_HEADERS_TRUNCATED': 'Response headers truncated',
-            'ERR_CONTENT_DECODING_FAILED': 'Content decoding failed'
-        }
-
         try:
-            # Check for Chrome error codes in page source
-            page_source = driver.page_source.lower()
-            for error_key, error_message in error_mappings.items():
-                if error_key.lower() in page_source:
-                    return error_message
+            # One round-trip: net error marker, HTTP status, title and a bounded text sample
+            page_state = driver.execute_script(
+                PAGE_ERROR_SCRIPT,
+                NET_ERROR_REGEX.pattern,
+                Configuration.get_config()["error_scan_chars"]
+            )
 
-            # Get page title and body text
-            page_title = driver.title.lower()
-            body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+            # Check for Chrome error codes in page source
+            if page_state['netError']:
+                return match_net_error(page_state['netError'])
 
             # Check response code from browser
-            navigation_entry = driver.execute_script("return window.performance.getEntriesByType('navigation')[0];")
-            if navigation_entry:
-                response_status = navigation_entry.get('responseStatus')
-                if response_status and response_status >= 400:
-                    return f"HTTP {response_status} Error"
+            response_status = page_state['responseStatus']
+            if response_status and response_status >= 400:
+                return format_http_error(response_status)
 
             # Check for error patterns in content
-            for error_code, patterns in error_patterns.items():
-                for pattern in patterns:
-                    if pattern in page_title or pattern in body_text:
-                        return f"HTTP {error_code} Error detected in page content"
+            error_code = match_content_error(page_state['title'], page_state['bodyText'])
+            if error_code:
+                return f"HTTP {error_code} Error detected in page content"
 
             return None
 
         except Exception as e:
-            error_str = str(e).lower()
             # Check for Selenium/Chrome specific errors
-            for error_key, error_message in error_mappings.items():
-                if error_key.lower() in error_str:
-                    return error_message
-            return f"Error checking page content: {str(e)}"
+            return match_net_error(str(e)) or f"Error checking page content: {str(e)}"
 
     @classmethod
-    def save_screenshot(cls, driver, url, row_number):
-        """Takes and saves screenshot with URL name"""
+    def save_screenshot(cls, driver, url, row_number, result=None):
+        """Takes screenshot once and queues it for saving with URL name.
+
+        Returns ``(filepath, png_bytes)`` so callers can reuse the captured
+        image without reading the file back, or ``(None, None)`` on failure.
+        The file is written by the screenshot sink in the background, which
+        also records final file paths and the report thumbnail on ``result``.
+        """
         try:
             url_name = URLHandler.get_clean_filename(url)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -158,25 +279,26 @@ class WebAutomation:
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    # Add a small delay before taking screenshot
-                    sleep(1)  # Using imported sleep instead of time.sleep
-                    driver.save_screenshot(filepath)
-                    print(f"Screenshot saved: {filepath}")
-
-                    # Attach to Allure report
-                    allure.attach(
-                        driver.get_screenshot_as_png(),
-                        name=f"Screenshot_{url_name}",
-                        attachment_type=allure.attachment_type.PNG
-                    )
-
-                    return filepath
+                    # Render once; the same bytes go to disk, Allure and the HTML report
+                    png = driver.get_screenshot_as_png()
+                    break
                 except Exception as e:
                     if attempt == max_retries - 1:
                         raise
                     print(f"Screenshot attempt {attempt + 1} failed, retrying...")
                     sleep(1)  # Using imported sleep instead of time.sleep
 
+            # Record the capture before queuing; the sink may update these fields once written
+            if result is not None:
+                result['screenshot'] = filepath
+                result['screenshot_data'] = png
+
+            # Disk write and Allure attachment happen off the browser's critical path
+            cls.get_screenshot_sink().submit(png, filepath, attachment_name=f"Screenshot_{url_name}",
+                                             result=result)
+            print(f"Screenshot queued: {filepath}")
+            return filepath, png
+
         except Exception as e:
             print(f"Error saving screenshot: {str(e)}")
             allure.attach(
@@ -184,96 +306,173 @@ class WebAutomation:
                 name="Screenshot Error",
                 attachment_type=allure.attachment_type.TEXT
             )
-            return None
+            return None, None
 
     @classmethod
     def process_url(cls, url, row_number):
         driver = None
+        pool = cls.get_driver_pool()
+        config = Configuration.get_config()
+        profiler = Profiler.from_config()
         start_time = time()
-        result = {
-            'url': url,
-            'status': 'Failed',
-            'load_time': 0,
-            'screenshot': None,
-            'error': None,
-            'start_time': start_time,
-            'timestamp': datetime.now().strftime('%H:%M:%S'),
-            'steps': []
-        }
+        host = None
+        navigation_start = navigation_time = None
+        result = ResultRecord(
+            url=url,
+            status='Failed',
+            load_time=0,
+            screenshot=None,
+            error=None,
+            start_time=start_time,
+            run_profile=Configuration.get_run_profile()["name"],
+            steps=[]
+        )
 
         try:
             print(f"\nProcessing URL: {url}")
-            result['steps'].append({
-                'status': 'INFO',
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'message': f"Starting to process URL: {url}"
-            })
-
-            driver = WebDriverSetup.create_driver()
+            result['steps'].append(StepRecord(StepStatus.INFO, f"Starting to process URL: {url}"))
+
+            if config["preflight_enabled"]:
+                with profiler.span("preflight"):
+                    probe = HTTPProbe.probe(url)
+                result['preflight'] = probe
+                result['steps'].append(StepRecord(
+                    StepStatus.INFO,
+                    f"Pre-flight check: HTTP {probe['status_code'] or 'N/A'} "
+                    f"in {probe['duration']:.2f}ms ({probe['redirects']} redirect(s))"
+                ))
+
+                if probe['hard_failure']:
+                    # DNS, refused connections and HTTP errors need no browser to classify
+                    result['error'] = probe['error']
+                    result['steps'].append(StepRecord(
+                        StepStatus.FAIL,
+                        f"Pre-flight check failed: {probe['error']}"
+                    ))
+                    return result
+
+                if not HTTPProbe.needs_browser(probe, config["capture_screenshots"]):
+                    result['status'] = 'Success'
+                    result['load_time'] = probe['duration']
+                    result['steps'].append(StepRecord(
+                        StepStatus.SUCCESS,
+                        "Pre-flight check passed; page does not need rendering"
+                    ))
+                    return result
+
+            # Includes creating or recycling a browser when none is idle
+            with profiler.span("acquire_driver"):
+                driver = pool.acquire()
+
+            # Bound the load by this host's latency history instead of the global timeout
+            host = URLHandler.extract_host_from_url(url)
+            page_load_timeout = config["page_load_timeout"]
+            if config["adaptive_timeouts_enabled"]:
+                page_load_timeout = LatencyHistory.get_shared().timeout_for(host)
+                result['steps'].append(StepRecord(
+                    StepStatus.INFO,
+                    f"Page load timeout for {host}: {page_load_timeout}s"
+                ))
+            # Pooled browsers keep the previous URL's timeout, so always set it
+            driver.set_page_load_timeout(page_load_timeout)
 
             # Navigate to URL
             formatted_url = URLHandler.format_url(url)
             print(f"Navigating to: {formatted_url}")
-            driver.get(formatted_url)
+            # Same check as create_driver: the performance log is only enabled when something is blocked
+            blocking = bool(RequestBlocker.get_patterns(config["resource_blocking"], config["blocked_url_patterns"]))
+            with profiler.span("page_load"):
+                if blocking:
+                    # Discard log events left over from the driver's previous use
+                    RequestBlocker.count_blocked(driver)
+                previous_href = None
+                if Configuration.get_run_profile()["page_load_strategy"] == "none":
+                    previous_href = driver.execute_script("return location.href")
+                with profiler.span("navigate"):
+                    navigation_start = time()
+                    driver.get(formatted_url)
+                    navigation_time = (time() - navigation_start) * 1000
+
+                # Wait for the page to settle so the screenshot shows the rendered page
+                with profiler.span("readiness"):
+                    page_loaded = cls.check_page_loaded(driver, timeout=min(30, page_load_timeout),
+                                                        previous_href=previous_href)
+                # driver.get returns early under eager/none, so the sample includes readiness
+                ready_time = (time() - navigation_start) * 1000
+
+            if blocking:
+                with profiler.span("blocked_count"):
+                    result['blocked_requests'] = RequestBlocker.count_blocked(driver)
+                result['steps'].append(StepRecord(
+                    StepStatus.INFO,
+                    f"Blocked {result['blocked_requests']} request(s) "
+                    f"(profile: {config['resource_blocking']})"
+                ))
+
+            # Site-side latency breakdown, independent of browser startup and screenshots
+            with profiler.span("navigation_timing"):
+                timing = NavigationTiming.collect(driver)
+            if timing:
+                result['timing'] = timing
+                result['steps'].append(StepRecord(
+                    StepStatus.INFO,
+                    f"Navigation timing: DNS {timing['dns']}ms, connect {timing['connect']}ms, "
+                    f"TLS {timing['tls']}ms, TTFB {timing['ttfb']}ms, "
+                    f"DOMContentLoaded {timing['dom_content_loaded']}ms, load {timing['load']}ms"
+                ))
 
             # Always try to take a screenshot, regardless of page load status
-            screenshot_path = cls.save_screenshot(driver, url, row_number)
+            screenshot_path = None
+            if config["capture_screenshots"]:
+                with profiler.span("screenshot"):
+                    screenshot_path, _ = cls.save_screenshot(driver, url, row_number, result)
             if screenshot_path:
-                result['screenshot'] = screenshot_path
-                result['steps'].append({
-                    'status': 'SUCCESS',
-                    'timestamp': datetime.now().strftime('%H:%M:%S'),
-                    'message': "Screenshot captured successfully"
-                })
-
-            # Continue with page load check and other processing
-            if cls.check_page_loaded(driver):
-                error = cls.check_page_errors(driver)
+                result['steps'].append(StepRecord(StepStatus.SUCCESS, "Screenshot captured successfully"))
+
+            # Continue with error checks and other processing
+            if page_loaded:
+                with profiler.span("error_check"):
+                    error = cls.check_page_errors(driver)
                 if error:
                     result['error'] = error
-                    result['steps'].append({
-                        'status': 'FAIL',
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'message': f"Page loaded but encountered error: {error}"
-                    })
+                    result['steps'].append(StepRecord(
+                        StepStatus.FAIL,
+                        f"Page loaded but encountered error: {error}"
+                    ))
                 else:
                     result['status'] = 'Success'
+                    if config["adaptive_timeouts_enabled"]:
+                        # The page's own load event when it fired, else the time until it was ready
+                        latency = (timing or {}).get('load') or ready_time
+                        LatencyHistory.get_shared().record(host, latency)
                     end_time = time()
                     result['load_time'] = (end_time - start_time) * 1000
-                    result['steps'].append({
-                        'status': 'SUCCESS',
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'message': f"Page loaded successfully in {result['load_time']:.2f}ms"
-                    })
+                    result['steps'].append(StepRecord(
+                        StepStatus.SUCCESS,
+                        f"Page loaded successfully in {result['load_time']:.2f}ms"
+                    ))
             else:
                 result['error'] = "Page load timeout"
-                result['steps'].append({
-                    'status': 'FAIL',
-                    'timestamp': datetime.now().strftime('%H:%M:%S'),
-                    'message': "Page failed to load completely"
-                })
+                if config["adaptive_timeouts_enabled"]:
+                    LatencyHistory.get_shared().record_timeout(host, time() - navigation_start)
+                result['steps'].append(StepRecord(StepStatus.FAIL, "Page failed to load completely"))
 
         except Exception as e:
             error_msg = str(e)
             print(f"Error processing URL: {error_msg}")
             result['error'] = error_msg
-            result['steps'].append({
-                'status': 'FATAL',
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'message': f"Error: {error_msg}"
-            })
+            result['steps'].append(StepRecord(StepStatus.FATAL, f"Error: {error_msg}"))
+            if (isinstance(e, TimeoutException) and navigation_start is not None and navigation_time is None
+                    and config["adaptive_timeouts_enabled"]):
+                # driver.get hit the page load timeout; the host needs longer than it was given
+                LatencyHistory.get_shared().record_timeout(host, time() - navigation_start)
 
             # Try to take screenshot even if there was an error
-            if driver:
+            if driver and config["capture_screenshots"]:
                 try:
-                    screenshot_path = cls.save_screenshot(driver, url, row_number)
+                    screenshot_path, _ = cls.save_screenshot(driver, url, row_number, result)
                     if screenshot_path:
-                        result['screenshot'] = screenshot_path
-                        result['steps'].append({
-                            'status': 'SUCCESS',
-                            'timestamp': datetime.now().strftime('%H:%M:%S'),
-                            'message': "Screenshot captured after error"
-                        })
+                        result['steps'].append(StepRecord(StepStatus.SUCCESS, "Screenshot captured after error"))
                 except Exception as screenshot_error:
                     print(f"Failed to capture error screenshot: {str(screenshot_error)}")
 
@@ -285,17 +484,17 @@ class WebAutomation:
 
             if driver:
                 try:
-                    driver.quit()
-                    result['steps'].append({
-                        'status': 'INFO',
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'message': "Browser closed successfully"
-                    })
+                    # Resets the browser, or quits it once it reached driver_max_uses
+                    with profiler.span("release_driver"):
+                        pool.release(driver, visited=[URLHandler.format_url(url)])
+                    result['steps'].append(StepRecord(StepStatus.INFO, "Browser returned to pool"))
                 except Exception as e:
-                    result['steps'].append({
-                        'status': 'FAIL',
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'message': f"Error closing browser: {str(e)}"
-                    })
+                    result['steps'].append(StepRecord(
+                        StepStatus.FAIL,
+                        f"Error returning browser to pool: {str(e)}"
+                    ))
+
+            if profiler.enabled:
+                result['stage_timings'] = profiler.results()
 
         return result